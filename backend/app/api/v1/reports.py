@@ -13,6 +13,7 @@ from typing import Optional
 import logging
 import json
 
+from app.core.config import settings
 from app.models import ReportResponse, MorningReport, AfternoonReport
 from app.services import LLMReport, DataService, TriggerService
 from app.api.dependencies import get_data_service
@@ -31,8 +32,12 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
+# 조회 엔드포인트는 DB 내용을 이미 MorningReport/AfternoonReport로 검증하므로,
+# MINT_FAST_SERIALIZE가 켜져 있으면 ReportResponse 재검증(dump → Union validate)을 생략
+_REPORT_RESPONSE_MODEL = None if settings.MINT_FAST_SERIALIZE else ReportResponse
 
-@router.get("/morning", response_model=ReportResponse)
+
+@router.get("/morning", response_model=_REPORT_RESPONSE_MODEL)
 async def get_morning_report(
     date: Optional[str] = Query(None, description="날짜 (YYYY-MM-DD, 기본값: 오늘)")
 ):
@@ -124,7 +129,7 @@ async def get_morning_report(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/afternoon", response_model=ReportResponse)
+@router.get("/afternoon", response_model=_REPORT_RESPONSE_MODEL)
 async def get_afternoon_report(
     date: Optional[str] = Query(None, description="날짜 (YYYY-MM-DD, 기본값: 오늘)")
 ):
@@ -48,6 +48,16 @@ class Settings(BaseSettings):
     GEMINI_MAX_TOKENS: int = 65536
     GEMINI_TEMPERATURE: float = 0.3
 
+    # LLM 응답 캐시 (개발/테스트용, 기본 비활성화)
+    MINT_LLM_CACHE: bool = False
+    LLM_CACHE_DIR: str = "./data/.llm_cache"
+
+    # 리포트 조회 응답의 response_model 재검증 생략 (테스트용, 기본 비활성화)
+    MINT_FAST_SERIALIZE: bool = False
+
+    # 뉴스 크롤링 동시 요청 수 (Morning Report Phase 2)
+    NEWS_CRAWL_CONCURRENCY: int = 16
+
     # 스케줄러
     SCHEDULER_ENABLED: bool = True
     MORNING_TRIGGER_TIME: str = "09:10"
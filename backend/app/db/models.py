@@ -123,8 +123,8 @@ class RealtimePrice(Base):
     """실시간 주가 테이블 (KIS REST API 폴링)"""
     __tablename__ = 'realtime_prices'
 
-    # Primary key
-    ticker = Column(String(10), primary_key=True, index=True)
+    # Primary key (PK 자동 인덱스로 조회, 별도 인덱스 없음)
+    ticker = Column(String(10), primary_key=True)
 
     # 가격 데이터
     current_price = Column(Integer, nullable=False)
@@ -150,10 +150,6 @@ class RealtimePrice(Base):
     updated_at = Column(DateTime, nullable=False, index=True)
     created_at = Column(DateTime, default=datetime.now)
 
-    __table_args__ = (
-        Index('idx_ticker_updated', 'ticker', 'updated_at'),
-    )
-
     def __repr__(self):
         return f"<RealtimePrice(ticker={self.ticker}, price={self.current_price}, change={self.change_rate}%, updated={self.updated_at})>"
 
@@ -9,6 +9,7 @@ MINT FastAPI 애플리케이션
 """
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from contextlib import asynccontextmanager
@@ -229,7 +230,8 @@ def create_app() -> FastAPI:
         version="0.1.0",
         docs_url="/docs" if settings.DEBUG else None,
         redoc_url="/redoc" if settings.DEBUG else None,
-        lifespan=lifespan  # 생명주기 이벤트 추가
+        lifespan=lifespan,  # 생명주기 이벤트 추가
+        default_response_class=ORJSONResponse  # orjson 직렬화 (대용량 리포트 응답)
     )
 
     # 미들웨어 설정
@@ -0,0 +1,77 @@
+"""
+LLM 응답 파일 캐시
+
+동일한 (날짜, 프롬프트) 조합의 LLM 응답을 파일로 저장해 재사용합니다.
+개발/테스트 중 리포트를 반복 생성할 때 LLM 호출을 생략하기 위한 용도이며,
+settings.MINT_LLM_CACHE가 켜져 있을 때만 동작합니다.
+(temperature가 낮은 결정적 생성에서만 의미가 있음)
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _cache_key(date: datetime, prompt: str) -> str:
+    """(날짜, 프롬프트) → SHA-256 캐시 키"""
+    return hashlib.sha256(f"{date:%Y%m%d}|{prompt}".encode("utf-8")).hexdigest()
+
+
+def cached_llm(ttl_hours: float = 24):
+    """
+    LLM 응답 캐시 데코레이터
+
+    (self, date, prompt, ...) 시그니처의 async 메서드에 적용하며,
+    JSON 직렬화 가능한 반환값을 {LLM_CACHE_DIR}/<key>.json 에 저장합니다.
+
+    Args:
+        ttl_hours: 캐시 유효 시간 (기본값: 24시간)
+
+    Example:
+        >>> @cached_llm(ttl_hours=24)
+        ... async def _generate_morning_response(self, date, prompt): ...
+    """
+    ttl_seconds = ttl_hours * 3600
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, date: datetime, prompt: str, *args, **kwargs):
+            if not settings.MINT_LLM_CACHE:
+                return await func(self, date, prompt, *args, **kwargs)
+
+            cache_dir = Path(settings.LLM_CACHE_DIR)
+            cache_file = cache_dir / f"{_cache_key(date, prompt)}.json"
+
+            # 캐시 조회
+            if cache_file.exists() and time.time() - cache_file.stat().st_mtime < ttl_seconds:
+                try:
+                    with open(cache_file, 'r', encoding='utf-8') as f:
+                        result = json.load(f)
+                    logger.info(f"LLM 캐시 사용: {cache_file.name}")
+                    return result
+                except (OSError, json.JSONDecodeError) as e:
+                    logger.warning(f"LLM 캐시 읽기 실패, 재생성: {e}")
+
+            result = await func(self, date, prompt, *args, **kwargs)
+
+            # 캐시 저장 (실패해도 결과는 반환)
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                with open(cache_file, 'w', encoding='utf-8') as f:
+                    json.dump(result, f, ensure_ascii=False, default=str)
+            except OSError as e:
+                logger.warning(f"LLM 캐시 저장 실패: {e}")
+
+            return result
+
+        return wrapper
+
+    return decorator
@@ -8,6 +8,7 @@ pykrx, DART API 등을 통해 주식 데이터를 수집합니다.
 """
 
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import logging
@@ -15,6 +16,7 @@ import time
 import asyncio
 from functools import lru_cache
 from app.utils.krx_data_client import stock
+from app.utils._atr_njit import atr_sma_last, atr_batch_kernel
 
 try:
     import OpenDartReader
@@ -1367,47 +1369,14 @@ class DataService:
             >>> print(f"ATR: {atr:,}원")
         """
         try:
-            # 과거 데이터 조회 (period + 여유분)
-            end_date = date
-            start_date = date - timedelta(days=period * 3)  # 거래일 확보를 위해 3배
-
-            end_str = end_date.strftime("%Y%m%d")
-            start_str = start_date.strftime("%Y%m%d")
-
-            # pykrx OHLCV 조회
-            df_ohlcv = await asyncio.to_thread(
-                stock.get_market_ohlcv_by_date,
-                start_str,
-                end_str,
-                ticker
-            )
-
-            if df_ohlcv.empty or len(df_ohlcv) < period + 1:
-                logger.warning(f"{ticker}: ATR 계산 불가 (데이터 부족: {len(df_ohlcv)}일, 필요: {period + 1}일)")
-                return None
+            ohlc = await self._fetch_atr_ohlc(ticker, date, period)
 
-            # 최신 데이터부터 period+1개 선택
-            df_ohlcv = df_ohlcv.tail(period + 1)
-
-            # True Range 계산 (krx_data_client는 영문 컬럼 반환)
-            high = df_ohlcv['High'].values
-            low = df_ohlcv['Low'].values
-            close = df_ohlcv['Close'].values
-
-            tr_list = []
-            for i in range(1, len(df_ohlcv)):
-                h_l = high[i] - low[i]
-                h_pc = abs(high[i] - close[i - 1])
-                l_pc = abs(low[i] - close[i - 1])
-                tr = max(h_l, h_pc, l_pc)
-                tr_list.append(tr)
-
-            # ATR = 평균 (최근 period개)
-            if len(tr_list) < period:
-                logger.warning(f"{ticker}: TR 계산 부족 ({len(tr_list)}/{period})")
+            if len(ohlc) < period + 1:
+                logger.warning(f"{ticker}: ATR 계산 불가 (데이터 부족: {len(ohlc)}일, 필요: {period + 1}일)")
                 return None
 
-            atr_value = sum(tr_list[-period:]) / period
+            # ATR = 최근 period개 TR의 평균
+            atr_value = atr_sma_last(ohlc[:, 0], ohlc[:, 1], ohlc[:, 2], period)
 
             logger.debug(f"{ticker}: ATR({period}) = {atr_value:,.0f}원")
             return round(atr_value, 2)
@@ -1416,6 +1385,41 @@ class DataService:
             logger.error(f"{ticker}: ATR 계산 실패 - {e}")
             return None
 
+    async def _fetch_atr_ohlc(
+        self,
+        ticker: str,
+        date: datetime,
+        period: int
+    ) -> np.ndarray:
+        """
+        ATR 계산용 최근 OHLC 조회
+
+        Returns:
+            (n, 3) float64 배열 (High, Low, Close 순, 최대 period + 1행)
+        """
+        # 과거 데이터 조회 (period + 여유분)
+        end_date = date
+        start_date = date - timedelta(days=period * 3)  # 거래일 확보를 위해 3배
+
+        end_str = end_date.strftime("%Y%m%d")
+        start_str = start_date.strftime("%Y%m%d")
+
+        # pykrx OHLCV 조회
+        df_ohlcv = await asyncio.to_thread(
+            stock.get_market_ohlcv_by_date,
+            start_str,
+            end_str,
+            ticker
+        )
+
+        if df_ohlcv.empty:
+            return np.empty((0, 3), dtype=np.float64)
+
+        # 최신 데이터부터 period+1개 선택 (krx_data_client는 영문 컬럼 반환)
+        return np.ascontiguousarray(
+            df_ohlcv[['High', 'Low', 'Close']].tail(period + 1).to_numpy(dtype=np.float64)
+        )
+
     async def get_atr_batch(
         self,
         tickers: List[str],
@@ -1439,21 +1443,37 @@ class DataService:
         """
         logger.info(f"ATR 배치 조회 시작: {len(tickers)}개 종목 (period={period})")
 
-        # 병렬 처리
-        tasks = [self.calculate_atr(ticker, date, period) for ticker in tickers]
-        atr_values = await asyncio.gather(*tasks, return_exceptions=True)
+        # 1) 히스토리 병렬 조회 (KRX API는 종목 단위 조회만 지원, 중복 종목은 한 번만 조회)
+        tickers = list(dict.fromkeys(tickers))
+        tasks = [self._fetch_atr_ohlc(ticker, date, period) for ticker in tickers]
+        histories = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # 2) (T, period + 1, 3) 텐서로 패킹 (부족한 구간은 NaN 패딩)
+        ohlc = np.full((len(tickers), period + 1, 3), np.nan, dtype=np.float64)
+        lengths = np.zeros(len(tickers), dtype=np.int64)
+
+        for i, (ticker, history) in enumerate(zip(tickers, histories)):
+            if isinstance(history, Exception):
+                logger.error(f"{ticker}: ATR 조회 오류 - {history}")
+                continue
+            if len(history) < period + 1:
+                logger.warning(f"{ticker}: ATR 계산 불가 (데이터 부족: {len(history)}일, 필요: {period + 1}일)")
+            ohlc[i, :len(history)] = history
+            lengths[i] = len(history)
+
+        # 3) 종목 단위 병렬 ATR 계산
+        atr_values = np.empty(len(tickers), dtype=np.float64)
+        atr_batch_kernel(ohlc, lengths, period, atr_values)
 
         result = {}
         success_count = 0
 
         for ticker, atr in zip(tickers, atr_values):
-            if isinstance(atr, Exception):
-                logger.error(f"{ticker}: ATR 조회 오류 - {atr}")
+            if np.isnan(atr):
                 result[ticker] = None
             else:
-                result[ticker] = atr
-                if atr is not None:
-                    success_count += 1
+                result[ticker] = round(float(atr), 2)
+                success_count += 1
 
         logger.info(f"ATR 배치 조회 완료: {success_count}/{len(tickers)}개 성공")
         return result
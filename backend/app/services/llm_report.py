@@ -34,7 +34,8 @@ from app.services.data_service import DataService
 from app.db.database import get_db
 from app.db.models import FinancialData
 from app.utils.normalization import ScoreCalculator
-from app.utils.llm_utils import deduplicate_news
+from app.utils.llm_utils import deduplicate_news_batch, get_sentence_model
+from app.services._llm_cache import cached_llm
 import pandas as pd
 import json
 
@@ -270,6 +271,61 @@ class LLMReport:
             logger.error(f"LLM API error (grounding): {e}")
             raise LLMAPIError(str(e))
 
+    @staticmethod
+    def _merge_rt_atr(
+        stocks: List[Dict],
+        realtime_prices: Dict[str, Dict],
+        atr_data: Dict[str, Optional[float]]
+    ) -> List[Dict]:
+        """
+        종목 리스트에 realtime_price, atr, atr_percent 병합 (in-place)
+
+        Args:
+            stocks: 종목 딕셔너리 리스트 (ticker 키 필수)
+            realtime_prices: {ticker: realtime_price 딕셔너리}
+            atr_data: {ticker: ATR}
+
+        Returns:
+            병합된 stocks (동일 객체)
+
+        Note:
+            current_price가 0 이하인 realtime_price는 None으로 처리
+        """
+        get_rt = realtime_prices.get
+        get_atr = atr_data.get
+
+        for stock in stocks:
+            ticker = stock['ticker']
+
+            rt = get_rt(ticker)
+            current_price = (rt.get('current_price') or 0) if rt else 0
+            if current_price <= 0:
+                rt = None
+            stock['realtime_price'] = rt
+
+            # ATR 비율 계산 (현재가 대비)
+            atr = get_atr(ticker)
+            stock['atr'] = atr
+            stock['atr_percent'] = round(atr / current_price * 100, 2) if atr and rt else None
+
+        return stocks
+
+    @cached_llm(ttl_hours=24)
+    async def _generate_morning_response(self, date: datetime, prompt: str) -> Dict:
+        """
+        Morning Report LLM 호출 (Google Search Grounding)
+
+        settings.MINT_LLM_CACHE가 켜져 있으면 (날짜, 프롬프트) 기준으로 응답을 캐싱합니다.
+
+        Args:
+            date: 리포트 날짜
+            prompt: Morning Report 프롬프트
+
+        Returns:
+            _generate_with_grounding 응답 딕셔너리
+        """
+        return await self._generate_with_grounding(prompt, temperature=0.3)
+
     async def generate_morning_report(
         self,
         date: datetime
@@ -316,41 +372,15 @@ class LLMReport:
             staleness_threshold=86400  # 24시간
         )
 
-        # Top 10에 realtime_prices 병합
-        for stock in top_10_stocks:
-            ticker = stock['ticker']
-            if ticker in realtime_prices:
-                rt = realtime_prices[ticker]
-                if rt.get('current_price', 0) > 0:
-                    stock['realtime_price'] = rt
-                    logger.debug(f"{ticker}: realtime_price 추가 (등락률: {rt.get('change_rate', 0):+.2f}%)")
-                else:
-                    stock['realtime_price'] = None
-            else:
-                stock['realtime_price'] = None
-                logger.debug(f"{ticker}: realtime_prices 데이터 없음")
-
-        realtime_count = sum(1 for s in top_10_stocks if s.get('realtime_price'))
-        logger.info(f"realtime_prices 병합 완료: {realtime_count}/{len(top_10_stocks)}개")
-
         # ===== Phase 2.6: ATR 계산 (동적 목표가/손절가용) =====
         logger.info("Phase 2.6: ATR 계산 (동적 목표가/손절가용)...")
         atr_data = await self.data_service.get_atr_batch(tickers, date, period=14)
 
-        # Top 10에 ATR 정보 병합
-        for stock in top_10_stocks:
-            ticker = stock['ticker']
-            stock['atr'] = atr_data.get(ticker)
+        # Top 10에 realtime_prices + ATR 병합
+        self._merge_rt_atr(top_10_stocks, realtime_prices, atr_data)
 
-            # ATR 비율 계산 (현재가 대비)
-            if stock['atr'] and stock.get('realtime_price'):
-                current_price = stock['realtime_price'].get('current_price', 0)
-                if current_price > 0:
-                    stock['atr_percent'] = round(stock['atr'] / current_price * 100, 2)
-                else:
-                    stock['atr_percent'] = None
-            else:
-                stock['atr_percent'] = None
+        realtime_count = sum(1 for s in top_10_stocks if s.get('realtime_price'))
+        logger.info(f"realtime_prices 병합 완료: {realtime_count}/{len(top_10_stocks)}개")
 
         atr_count = sum(1 for s in top_10_stocks if s.get('atr'))
         logger.info(f"ATR 병합 완료: {atr_count}/{len(top_10_stocks)}개")
@@ -362,7 +392,7 @@ class LLMReport:
         # Phase 4: LLM 호출 (Google Search Grounding)
         logger.info("Phase 4: LLM 호출 (Google Search Grounding)...")
         try:
-            response = await self._generate_with_grounding(prompt, temperature=0.3)
+            response = await self._generate_morning_response(date, prompt)
             response_text = response['text']
 
             # JSON 파싱
@@ -594,9 +624,8 @@ class LLMReport:
 
         # Phase 1.1-2: DB에서 재무 데이터 조회
         with get_db() as db:
-            all_stocks = db.query(FinancialData).all()
-            # 세션 내에서 to_dict() 호출 (detached 오류 방지)
-            df_financial = pd.DataFrame([stock.to_dict() for stock in all_stocks])
+            # ORM 객체 생성 없이 DB-API 결과를 바로 DataFrame으로 로드
+            df_financial = pd.read_sql(db.query(FinancialData).statement, db.connection())
         logger.info(f"DB 조회 완료: {len(df_financial)}개 종목")
 
         # Phase 1.1-3: 시장 스냅샷과 재무 데이터 merge (inner join)
@@ -1410,43 +1439,57 @@ JSON만 반환하세요.
         Returns:
             {ticker: [중복 제거된 뉴스 목록]}
         """
-        news_by_ticker = {}
-
-        for idx, row in top_50.iterrows():
-            ticker = row['ticker']
-            name = row.get('name', ticker)
+        semaphore = asyncio.Semaphore(settings.NEWS_CRAWL_CONCURRENCY)
+        cutoff_date = datetime.now() - timedelta(days=5)
 
+        async def _fetch(ticker: str, name: str) -> List[Dict]:
             try:
-                # 뉴스 크롤링 (최신 10페이지)
-                news_list = await self.data_service.get_news_data(ticker, days=5)
+                # 뉴스 크롤링 (최신 10페이지), 동시 요청 수 제한
+                async with semaphore:
+                    news_list = await self.data_service.get_news_data(ticker, days=5)
+            except Exception as e:
+                logger.error(f"{ticker} ({name}): 뉴스 크롤링 실패 - {e}")
+                return []
 
-                if not news_list:
-                    logger.warning(f"{ticker} ({name}): 뉴스 없음")
-                    news_by_ticker[ticker] = []
-                    continue
+            if not news_list:
+                logger.warning(f"{ticker} ({name}): 뉴스 없음")
+                return []
 
-                # 5일 이내 뉴스만 필터링
-                from datetime import datetime, timedelta
-                cutoff_date = datetime.now() - timedelta(days=5)
-                recent_news = [
-                    news for news in news_list
-                    if news.get('published_at', datetime.min) >= cutoff_date
-                ]
+            # 5일 이내 뉴스만 필터링
+            recent_news = [
+                news for news in news_list
+                if news.get('published_at', datetime.min) >= cutoff_date
+            ]
 
-                logger.info(f"{ticker} ({name}): 뉴스 {len(news_list)}개 → 5일 이내 {len(recent_news)}개")
+            logger.info(f"{ticker} ({name}): 뉴스 {len(news_list)}개 → 5일 이내 {len(recent_news)}개")
+            return recent_news
 
-                # STS 중복 제거 (ko-sbert-sts, threshold=0.66)
-                deduplicated_news = deduplicate_news(
-                    recent_news,
-                    threshold=0.66
-                )
+        tickers = top_50['ticker'].tolist()
+        names = top_50['name'].tolist() if 'name' in top_50.columns else tickers
 
-                logger.info(f"{ticker} ({name}): 중복 제거 후 {len(deduplicated_news)}개")
-                news_by_ticker[ticker] = deduplicated_news
+        # STS 모델 로드를 크롤링과 병렬로 진행 (이미 로드되어 있으면 즉시 반환)
+        model_warmup = asyncio.create_task(asyncio.to_thread(get_sentence_model))
 
-            except Exception as e:
-                logger.error(f"{ticker} ({name}): 뉴스 크롤링 실패 - {e}")
-                news_by_ticker[ticker] = []
+        recent_by_ticker = await asyncio.gather(
+            *[_fetch(ticker, name) for ticker, name in zip(tickers, names)]
+        )
+        await model_warmup
+
+        # STS 중복 제거 (ko-sbert-sts, threshold=0.66): 전 종목 제목을 한 번에 임베딩
+        try:
+            deduplicated_by_ticker = await asyncio.to_thread(
+                deduplicate_news_batch,
+                recent_by_ticker,
+                threshold=0.66
+            )
+        except Exception as e:
+            logger.error(f"뉴스 중복 제거 실패 - {e}")
+            deduplicated_by_ticker = recent_by_ticker
+
+        news_by_ticker = {}
+        for ticker, name, deduplicated_news in zip(tickers, names, deduplicated_by_ticker):
+            logger.info(f"{ticker} ({name}): 중복 제거 후 {len(deduplicated_news)}개")
+            news_by_ticker[ticker] = deduplicated_news
 
         return news_by_ticker
 
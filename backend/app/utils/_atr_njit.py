@@ -0,0 +1,59 @@
+"""
+ATR (Average True Range) JIT 커널
+
+TR = max(High - Low, |High - Prev Close|, |Low - Prev Close|)
+ATR = SMA(TR, period)
+"""
+
+import numpy as np
+
+from app.utils._njit import njit, prange
+
+
+@njit(cache=True)
+def atr_sma_last(high, low, close, period):
+    """
+    최신 ATR 계산 (마지막 period개 TR의 단순평균)
+
+    Args:
+        high: 고가 배열 (float64, 오래된 날짜 → 최신 날짜 순)
+        low: 저가 배열
+        close: 종가 배열
+        period: ATR 기간
+
+    Returns:
+        ATR 값 (데이터가 period + 1개 미만이면 NaN)
+    """
+    n = high.size
+    if n < period + 1:
+        return np.nan
+
+    total = 0.0
+    for i in range(n - period, n):
+        h_l = high[i] - low[i]
+        h_pc = abs(high[i] - close[i - 1])
+        l_pc = abs(low[i] - close[i - 1])
+        total += max(h_l, h_pc, l_pc)
+
+    return total / period
+
+
+@njit(parallel=True, cache=True)
+def atr_batch_kernel(ohlc, lengths, period, out):
+    """
+    여러 종목의 ATR을 종목 단위로 병렬 계산
+
+    Args:
+        ohlc: (T, N, 3) float64 텐서 (High, Low, Close 순, 길이가 N보다 짧은 종목은 NaN 패딩)
+        lengths: (T,) 종목별 유효 데이터 길이
+        period: ATR 기간
+        out: (T,) 결과 배열 (계산 불가 종목은 NaN)
+    """
+    for t in prange(ohlc.shape[0]):
+        n = lengths[t]
+        out[t] = atr_sma_last(
+            ohlc[t, :n, 0],
+            ohlc[t, :n, 1],
+            ohlc[t, :n, 2],
+            period
+        )
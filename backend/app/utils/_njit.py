@@ -0,0 +1,28 @@
+"""
+Numba JIT 헬퍼
+
+numba가 설치되어 있으면 njit/prange를 그대로 사용하고,
+설치되어 있지 않으면 원본 함수를 그대로 반환하는 no-op 데코레이터로 대체합니다.
+(커널은 NumPy 배열 연산으로 작성되어 있어 JIT 없이도 동일하게 동작)
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """numba 미설치 시 no-op 데코레이터"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+    prange = range
+
+
+__all__ = ["njit", "prange", "NUMBA_AVAILABLE"]
@@ -7,18 +7,145 @@
 종목 필터링 조건 적용
 """
 
+import re
+import operator
+from functools import reduce
+from itertools import count
 import pandas as pd
+import numpy as np
 from typing import Optional
 import logging
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# 관리종목 키워드: '관리', '정리', '거래정지', '투자위험', '투자경고'
+ADMIN_KEYWORDS = ('관리', '정리', '거래정지', '투자위험', '투자경고')
+
+
+def _build_admin_matcher():
+    """
+    관리종목 키워드 매처 생성 (모듈 로드 시 1회)
+
+    pyahocorasick이 설치되어 있으면 Aho-Corasick 오토마톤을 사용하여
+    종목명 길이에 비례하는 시간으로 전체 키워드를 한 번에 검사합니다.
+    설치되어 있지 않으면 None을 반환하고 정규식 경로를 사용합니다.
+    """
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for keyword in ADMIN_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_ADMIN_AUTOMATON = _build_admin_matcher()
+_ADMIN_PATTERN = re.compile('|'.join(ADMIN_KEYWORDS))
+
+# _FilterExpr 바인딩 변수명 충돌 방지용 카운터
+_binding_ids = count()
+
+
+class _FilterExpr:
+    """
+    지연 평가 필터 표현식
+
+    각 필터 조건을 pandas eval 문자열로 보관하고, & 로 조합한 뒤
+    collect() 시점에 한 번의 boolean mask로 적용합니다.
+    (중간 데이터프레임 생성 없이 N개 필터를 단일 패스로 처리)
+
+    Example:
+        >>> expr = StockFilter.uptrend_expr() & StockFilter.intraday_rise_expr(3.0)
+        >>> filtered = expr.collect(df)
+    """
+
+    def __init__(self, pred: str, bindings: Optional[dict] = None):
+        self.pred = pred
+        self.bindings = bindings or {}
+
+    @classmethod
+    def with_params(cls, template: str, **params) -> "_FilterExpr":
+        """
+        파라미터를 고유한 바인딩 이름으로 치환하여 표현식 생성
+
+        Args:
+            template: '{name}' 형태의 placeholder를 포함한 조건식
+            **params: placeholder에 바인딩할 값
+
+        Returns:
+            _FilterExpr
+        """
+        names = {key: f"_b{next(_binding_ids)}" for key in params}
+        pred = template.format(**{key: f"@{name}" for key, name in names.items()})
+        bindings = {names[key]: value for key, value in params.items()}
+        return cls(pred, bindings)
+
+    def __and__(self, other: "_FilterExpr") -> "_FilterExpr":
+        return _FilterExpr(
+            f"({self.pred}) & ({other.pred})",
+            {**self.bindings, **other.bindings}
+        )
+
+    def mask(self, df: pd.DataFrame) -> pd.Series:
+        """조건식을 평가하여 boolean mask 반환"""
+        return df.eval(self.pred, local_dict=self.bindings)
+
+    def collect(self, df: pd.DataFrame) -> pd.DataFrame:
+        """조건식을 적용한 데이터프레임 반환"""
+        if df.empty:
+            return df.copy()
+        return df[self.mask(df)].copy()
+
 
 class StockFilter:
     """종목 필터링 클래스"""
 
+    @staticmethod
+    def uptrend_expr() -> _FilterExpr:
+        """상승 종목 조건 (종가 > 시가)"""
+        return _FilterExpr("`종가` > `시가`")
+
+    @staticmethod
+    def downtrend_expr() -> _FilterExpr:
+        """하락 종목 조건 (종가 < 시가)"""
+        return _FilterExpr("`종가` < `시가`")
+
+    @staticmethod
+    def sideways_expr(threshold: float = 5.0) -> _FilterExpr:
+        """횡보 종목 조건 (abs(등락률) <= threshold)"""
+        return _FilterExpr.with_params(
+            "abs((`종가` / `시가` - 1) * 100) <= {threshold}",
+            threshold=threshold
+        )
+
+    @staticmethod
+    def volume_increase_expr(
+        current_col: str = '거래량',
+        prev_col: str = '거래량_전일',
+        min_increase_rate: float = 30.0
+    ) -> _FilterExpr:
+        """거래량 증가율 조건 ((현재 / 전일 - 1) × 100 >= min_increase_rate)"""
+        return _FilterExpr.with_params(
+            f"(`{current_col}` / `{prev_col}` - 1) * 100 >= {{min_increase_rate}}",
+            min_increase_rate=min_increase_rate
+        )
+
+    @staticmethod
+    def intraday_rise_expr(min_rise_rate: float = 3.0) -> _FilterExpr:
+        """일중 상승률 조건 ((종가 / 시가 - 1) × 100 >= min_rise_rate)"""
+        return _FilterExpr.with_params(
+            "(`종가` / `시가` - 1) * 100 >= {min_rise_rate}",
+            min_rise_rate=min_rise_rate
+        )
+
     @staticmethod
     def apply_absolute_filters(
         df: pd.DataFrame,
@@ -88,7 +215,7 @@ class StockFilter:
             >>> uptrend = StockFilter.filter_uptrend_only(df)
         """
         initial_count = len(df)
-        df = df[df['종가'] > df['시가']].copy()
+        df = StockFilter.uptrend_expr().collect(df)
         filtered_count = len(df)
 
         logger.debug(f"상승 종목 필터: {initial_count}개 → {filtered_count}개")
@@ -106,7 +233,7 @@ class StockFilter:
             하락 종목만 포함된 데이터프레임
         """
         initial_count = len(df)
-        df = df[df['종가'] < df['시가']].copy()
+        df = StockFilter.downtrend_expr().collect(df)
         filtered_count = len(df)
 
         logger.debug(f"하락 종목 필터: {initial_count}개 → {filtered_count}개")
@@ -132,11 +259,8 @@ class StockFilter:
         """
         initial_count = len(df)
 
-        # 등락률 계산 = (종가 / 시가 - 1) × 100
-        intraday_change = (df['종가'] / df['시가'] - 1) * 100
-
-        # abs(등락률) <= threshold 조건
-        df = df[intraday_change.abs() <= threshold].copy()
+        # abs(등락률) <= threshold 조건, 등락률 = (종가 / 시가 - 1) × 100
+        df = StockFilter.sideways_expr(threshold).collect(df)
         filtered_count = len(df)
 
         logger.debug(f"횡보 종목 필터 (±{threshold}%): {initial_count}개 → {filtered_count}개")
@@ -166,11 +290,10 @@ class StockFilter:
         """
         initial_count = len(df)
 
-        # 거래량 증가율 계산 = (현재 / 전일 - 1) × 100
-        volume_increase_rate = (df[current_col] / df[prev_col] - 1) * 100
-
-        # min_increase_rate 이상 필터링
-        df = df[volume_increase_rate >= min_increase_rate].copy()
+        # 거래량 증가율 = (현재 / 전일 - 1) × 100 >= min_increase_rate
+        df = StockFilter.volume_increase_expr(
+            current_col, prev_col, min_increase_rate
+        ).collect(df)
         filtered_count = len(df)
 
         logger.debug(f"거래량 증가율 필터 (>={min_increase_rate}%): {initial_count}개 → {filtered_count}개")
@@ -235,11 +358,8 @@ class StockFilter:
         """
         initial_count = len(df)
 
-        # 일중 등락률 계산 = (종가 / 시가 - 1) × 100
-        intraday_change = (df['종가'] / df['시가'] - 1) * 100
-
-        # min_rise_rate 이상 필터링
-        df = df[intraday_change >= min_rise_rate].copy()
+        # 일중 등락률 = (종가 / 시가 - 1) × 100 >= min_rise_rate
+        df = StockFilter.intraday_rise_expr(min_rise_rate).collect(df)
         filtered_count = len(df)
 
         logger.debug(f"일중 상승률 필터 (>={min_rise_rate}%): {initial_count}개 → {filtered_count}개")
@@ -311,7 +431,17 @@ class StockFilter:
             return pd.DataFrame()
 
         # sector 컬럼이 sectors에 포함된 종목만 필터링
-        df = df[df[sector_col].isin(sectors)].copy()
+        sector_series = df[sector_col]
+        if isinstance(sector_series.dtype, pd.CategoricalDtype):
+            # 이미 categorical이면 문자열 해시 조회 대신 정수 코드로 비교
+            categories = sector_series.cat.categories
+            allowed_codes = categories.get_indexer(pd.Index(sectors).unique())
+            allowed_codes = allowed_codes[allowed_codes >= 0]
+            mask = np.isin(sector_series.cat.codes.to_numpy(), allowed_codes)
+        else:
+            # 매 호출마다 category 변환 비용을 내지 않도록 isin 사용
+            mask = sector_series.isin(sectors)
+        df = df[mask].copy()
         filtered_count = len(df)
 
         logger.debug(f"업종 필터 ({len(sectors)}개 업종): {initial_count}개 → {filtered_count}개")
@@ -385,11 +515,18 @@ class StockFilter:
             logger.warning("종목명 컬럼을 찾을 수 없습니다. 전체 데이터프레임 반환")
             return df
 
-        # 키워드: '관리', '정리', '거래정지', '투자위험', '투자경고'
-        admin_keywords = ['관리', '정리', '거래정지', '투자위험', '투자경고']
-
         # 키워드가 포함된 종목 제외
-        mask = ~df[name_col].str.contains('|'.join(admin_keywords), na=False)
+        if _ADMIN_AUTOMATON is not None:
+            mask = np.fromiter(
+                (
+                    not isinstance(name, str) or next(_ADMIN_AUTOMATON.iter(name), None) is None
+                    for name in df[name_col].to_numpy()
+                ),
+                dtype=bool,
+                count=len(df)
+            )
+        else:
+            mask = ~df[name_col].str.contains(_ADMIN_PATTERN, na=False)
         df = df[mask].copy()
 
         filtered_count = len(df)
@@ -433,14 +570,15 @@ class StockFilter:
     @staticmethod
     def combine_filters(
         df: pd.DataFrame,
-        filters: list[callable]
+        filters: list
     ) -> pd.DataFrame:
         """
         여러 필터 조합 적용
 
         Args:
             df: 데이터프레임
-            filters: 필터 함수 리스트
+            filters: 필터 함수 리스트 또는 _FilterExpr 리스트
+                (모두 _FilterExpr이면 하나의 조건식으로 합쳐 단일 패스로 적용)
 
         Returns:
             모든 필터 적용된 데이터프레임
@@ -453,10 +591,21 @@ class StockFilter:
             ...         lambda x: StockFilter.filter_uptrend_only(x)
             ...     ]
             ... )
+            >>> filtered = StockFilter.combine_filters(
+            ...     df,
+            ...     filters=[StockFilter.uptrend_expr(), StockFilter.intraday_rise_expr(3.0)]
+            ... )
         """
         initial_count = len(df)
         logger.info(f"필터 조합 시작: {initial_count}개 종목, {len(filters)}개 필터")
 
+        # 지연 평가 표현식만 있으면 하나로 합쳐 중간 데이터프레임 없이 적용
+        if filters and all(isinstance(f, _FilterExpr) for f in filters):
+            df = reduce(operator.and_, filters).collect(df)
+            final_count = len(df)
+            logger.info(f"필터 조합 완료: {initial_count}개 → {final_count}개 (제거: {initial_count - final_count}개)")
+            return df
+
         # 각 필터를 순차적으로 적용
         for i, filter_func in enumerate(filters, 1):
             before_count = len(df)
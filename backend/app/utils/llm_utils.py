@@ -6,6 +6,7 @@ RateLimiter, CostTracker, 예외 클래스 등 LLM 서비스에서 공통으로
 
 import logging
 import asyncio
+import threading
 from datetime import datetime, timedelta
 from collections import deque
 
@@ -116,19 +117,28 @@ class CostTracker:
 # ============= Sentence Transformer (지연 로딩) =============
 
 _sentence_model = None
+_sentence_model_lock = threading.Lock()
 
 def get_sentence_model():
-    """Sentence Transformer 모델 로드 (싱글톤)"""
+    """
+    Sentence Transformer 모델 로드 (싱글톤)
+
+    로드에 성공한 모델만 보관하고, 실패하면 None을 반환한 뒤 다음 호출에서 재시도합니다.
+    (워밍업 스레드와 동시에 호출돼도 모델은 한 번만 로드)
+    """
     global _sentence_model
-    if _sentence_model is None:
-        try:
-            from sentence_transformers import SentenceTransformer
-            logger.info("Loading ko-sbert-sts model...")
-            _sentence_model = SentenceTransformer('jhgan/ko-sbert-sts')
-            logger.info("ko-sbert-sts model loaded successfully")
-        except Exception as e:
-            logger.error(f"Failed to load sentence transformer: {e}")
-            _sentence_model = None
+    if _sentence_model is not None:
+        return _sentence_model
+
+    with _sentence_model_lock:
+        if _sentence_model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+                logger.info("Loading ko-sbert-sts model...")
+                _sentence_model = SentenceTransformer('jhgan/ko-sbert-sts')
+                logger.info("ko-sbert-sts model loaded successfully")
+            except Exception as e:
+                logger.error(f"Failed to load sentence transformer: {e}")
     return _sentence_model
 
 
@@ -166,7 +176,7 @@ def deduplicate_news(news_list: list[dict], threshold: float = 0.66) -> list[dic
         return news_list
 
     try:
-        from sklearn.metrics.pairwise import cosine_similarity
+        from sklearn.metrics.pairwise import cosine_similarity  # noqa: F401
     except ImportError:
         logger.error("scikit-learn not installed, 중복 제거 스킵")
         return news_list
@@ -183,7 +193,13 @@ def deduplicate_news(news_list: list[dict], threshold: float = 0.66) -> list[dic
     # 제목들을 임베딩으로 변환
     embeddings = model.encode(titles, convert_to_numpy=True, show_progress_bar=False)
 
-    # 중복 제거 로직
+    return _deduplicate_by_embeddings(news_list, titles, embeddings, threshold)
+
+
+def _deduplicate_by_embeddings(news_list, titles, embeddings, threshold) -> list[dict]:
+    """임베딩이 계산된 뉴스 목록에서 이미 선택된 뉴스와 유사한 뉴스를 순차적으로 제거"""
+    from sklearn.metrics.pairwise import cosine_similarity
+
     deduplicated = []
     deduplicated_indices = []
 
@@ -209,3 +225,69 @@ def deduplicate_news(news_list: list[dict], threshold: float = 0.66) -> list[dic
 
     logger.info(f"중복 제거: {len(news_list)}개 → {len(deduplicated)}개 (제거: {len(news_list) - len(deduplicated)}개)")
     return deduplicated
+
+
+def deduplicate_news_batch(
+    news_lists: list[list[dict]],
+    threshold: float = 0.66,
+    batch_size: int = 64
+) -> list[list[dict]]:
+    """
+    여러 종목의 뉴스 목록을 한 번에 중복 제거
+
+    모든 제목을 한 번의 model.encode() 호출로 임베딩한 뒤 목록별로 나누어
+    deduplicate_news()와 동일한 기준으로 중복을 제거합니다.
+    (종목마다 작은 encode를 반복하는 대신 배치 추론 1회)
+
+    Args:
+        news_lists: 종목별 뉴스 목록의 리스트
+        threshold: 유사도 임계값 (코사인 유사도)
+        batch_size: encode 배치 크기
+
+    Returns:
+        입력 순서와 동일한 중복 제거된 뉴스 목록의 리스트
+    """
+    model = get_sentence_model()
+
+    if model is None:
+        logger.warning("STS 모델 로드 실패, 중복 제거 스킵")
+        return [list(news_list) for news_list in news_lists]
+
+    try:
+        from sklearn.metrics.pairwise import cosine_similarity  # noqa: F401
+    except ImportError:
+        logger.error("scikit-learn not installed, 중복 제거 스킵")
+        return [list(news_list) for news_list in news_lists]
+
+    # 목록별 제목 추출 (빈 제목 제거) 후 하나의 리스트로 평탄화
+    titles_per_list = [
+        [t for t in (news.get('title', '') for news in news_list) if t]
+        for news_list in news_lists
+    ]
+    all_titles = [t for titles in titles_per_list for t in titles]
+
+    if not all_titles:
+        return [[] for _ in news_lists]
+
+    logger.info(f"STS 모델로 {len(news_lists)}개 목록, {len(all_titles)}개 뉴스 임베딩 일괄 생성 중...")
+    all_embeddings = model.encode(
+        all_titles,
+        batch_size=batch_size,
+        convert_to_numpy=True,
+        show_progress_bar=False
+    )
+
+    results = []
+    offset = 0
+    for news_list, titles in zip(news_lists, titles_per_list):
+        if not titles:
+            results.append([])
+            continue
+
+        embeddings = all_embeddings[offset:offset + len(titles)]
+        offset += len(titles)
+        results.append(
+            _deduplicate_by_embeddings(news_list, titles, embeddings, threshold)
+        )
+
+    return results
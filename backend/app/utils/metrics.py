@@ -158,17 +158,43 @@ class MetricsCalculator:
             >>> mas = MetricsCalculator.calculate_moving_averages(prices)
             >>> print(mas[20])  # 20일 이동평균
         """
+        # 단일 종목 = 1행짜리 배치로 계산
+        values = prices.to_numpy(dtype=np.float64)[None, :]
+        batch = MetricsCalculator.calculate_moving_averages_batch(values, periods)
+
+        return {period: float(ma[0]) for period, ma in batch.items()}
+
+    @staticmethod
+    def calculate_moving_averages_batch(
+        prices_2d: np.ndarray,
+        periods: tuple[int, ...] = (5, 20, 60)
+    ) -> Dict[int, np.ndarray]:
+        """
+        여러 종목의 최신 이동평균선 일괄 계산
+
+        Args:
+            prices_2d: (종목 수, 일수) 종가 배열 (오래된 날짜 → 최신 날짜 순)
+            periods: 이동평균 기간 (기본값: (5, 20, 60))
+
+        Returns:
+            {5: array([...]), 20: array([...]), 60: array([...])}
+            (데이터 부족 또는 NaN 포함 시 0.0)
+
+        Example:
+            >>> mas = MetricsCalculator.calculate_moving_averages_batch(prices_2d)
+            >>> print(mas[20][0])  # 첫 번째 종목의 20일 이동평균
+        """
+        n_tickers, n_days = prices_2d.shape
         result = {}
 
-        # 각 기간별 단순이동평균 계산
+        # 최신 이동평균만 필요하므로 마지막 period개 구간만 평균
         for period in periods:
-            if len(prices) >= period:
-                # SMA = sum(prices[-period:]) / period
-                ma = prices.rolling(window=period).mean().iloc[-1]
-                result[period] = float(ma) if not np.isnan(ma) else 0.0
+            if n_days >= period:
+                ma = prices_2d[:, -period:].mean(axis=1)
+                result[period] = np.where(np.isnan(ma), 0.0, ma)
             else:
                 logger.warning(f"{period}일 이동평균 계산에 충분한 데이터가 없습니다")
-                result[period] = 0.0
+                result[period] = np.zeros(n_tickers, dtype=np.float64)
 
         return result
 
@@ -9,15 +9,100 @@ Min-Max 정규화, Z-Score 정규화, 복합 점수 계산
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 import logging
 
+from app.utils._njit import njit
+
 logger = logging.getLogger(__name__)
 
 
+def _to_float_array(values: pd.Series) -> np.ndarray:
+    """Series → float64 NumPy 배열 (결측치는 NaN)"""
+    return values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+@lru_cache(maxsize=128)
+def _compile_weights(weight_items: Tuple[Tuple[str, float], ...]) -> Tuple[Tuple[str, ...], np.ndarray]:
+    """
+    가중치 딕셔너리 항목 → (지표명 튜플, 가중치 배열)
+
+    동일한 가중치로 반복 호출될 때 배열 생성을 건너뛰도록 캐싱합니다.
+    """
+    keys = tuple(metric for metric, _ in weight_items)
+    weights = np.fromiter(
+        (weight for _, weight in weight_items),
+        dtype=np.float64,
+        count=len(weight_items)
+    )
+    weights.flags.writeable = False
+    return keys, weights
+
+
+# ============================================================
+# JIT 커널 (NaN은 pandas와 동일하게 통계 계산에서 제외)
+# fastmath는 NaN 처리 의미를 바꾸므로 사용하지 않음
+# ============================================================
+
+@njit(cache=True)
+def _min_max_kernel(arr, new_min, new_max):
+    valid = arr[~np.isnan(arr)]
+    if valid.size == 0:
+        return np.full(arr.size, np.nan)
+
+    min_val = valid.min()
+    max_val = valid.max()
+
+    # 모든 값이 동일한 경우
+    if max_val == min_val:
+        return np.full(arr.size, 0.5)
+
+    normalized = (arr - min_val) / (max_val - min_val)
+    return normalized * (new_max - new_min) + new_min
+
+
+@njit(cache=True)
+def _z_score_kernel(arr):
+    out = np.empty_like(arr)
+    n = arr.size - np.isnan(arr).sum()
+
+    # 표본 표준편차(ddof=1)를 계산할 수 없는 경우
+    if n < 2:
+        out[:] = 0.0
+        return out
+
+    std = np.sqrt(np.nanvar(arr) * n / (n - 1))
+    if std == 0:
+        out[:] = 0.0
+        return out
+
+    # 출력 버퍼 하나에서 (x - mean) / std 계산
+    np.subtract(arr, np.nanmean(arr), out)
+    np.divide(out, std, out)
+    return out
+
+
+@njit(cache=True)
+def _robust_kernel(arr):
+    valid = arr[~np.isnan(arr)]
+    if valid.size == 0:
+        return np.zeros(arr.size)
+
+    median = np.median(valid)
+    iqr = np.percentile(valid, 75.0) - np.percentile(valid, 25.0)
+    if iqr == 0 or np.isnan(iqr):
+        return np.zeros(arr.size)
+
+    return (arr - median) / iqr
+
+
 class ScoreCalculator:
     """점수 계산 클래스"""
 
+    # 상태 없는 유틸리티 클래스 (모든 메서드는 @staticmethod)
+    __slots__ = ()
+
     @staticmethod
     def min_max_normalize(
         values: pd.Series,
@@ -42,20 +127,8 @@ class ScoreCalculator:
             >>> normalized = ScoreCalculator.min_max_normalize(values)
             >>> print(normalized)  # [0.0, 0.25, 0.5, 0.75, 1.0]
         """
-        min_val = values.min()
-        max_val = values.max()
-
-        # 모든 값이 동일한 경우
-        if max_val == min_val:
-            return pd.Series(0.5, index=values.index)
-
-        # 0-1 정규화
-        normalized = (values - min_val) / (max_val - min_val)
-
-        # new_min, new_max 범위로 변환
-        normalized = normalized * (new_max - new_min) + new_min
-
-        return normalized
+        normalized = _min_max_kernel(_to_float_array(values), float(new_min), float(new_max))
+        return pd.Series(normalized, index=values.index, name=values.name)
 
     @staticmethod
     def z_score_normalize(values: pd.Series) -> pd.Series:
@@ -74,15 +147,9 @@ class ScoreCalculator:
             >>> values = pd.Series([10, 20, 30, 40, 50])
             >>> z_scores = ScoreCalculator.z_score_normalize(values)
         """
-        mean = values.mean()
-        std = values.std()
-
-        # std == 0인 경우 처리 (모두 0 반환)
-        if std == 0 or np.isnan(std):
-            return pd.Series(0.0, index=values.index)
-
-        # (values - mean) / std
-        return (values - mean) / std
+        # (values - mean) / std, std == 0인 경우 모두 0 반환
+        z_scores = _z_score_kernel(_to_float_array(values))
+        return pd.Series(z_scores, index=values.index, name=values.name)
 
     @staticmethod
     def normalize_and_score(
@@ -117,18 +184,30 @@ class ScoreCalculator:
         if not np.isclose(sum(weights), 1.0):
             raise ValueError(f"Weights must sum to 1.0, got {sum(weights)}")
 
-        # 각 컬럼 Min-Max 정규화
-        normalized_cols = []
-        for col in columns:
-            norm_col_name = f"{col}_norm"
-            df[norm_col_name] = ScoreCalculator.min_max_normalize(df[col])
-            normalized_cols.append(norm_col_name)
+        if len(df) == 0:
+            for col in columns:
+                df[f"{col}_norm"] = pd.Series(dtype=np.float64)
+            df[output_col] = pd.Series(dtype=np.float64)
+            return df
+
+        # (행 수, 컬럼 수) 행렬로 한 번에 처리
+        matrix = df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        # 컬럼별 Min-Max 정규화 (broadcasting)
+        min_vals = np.nanmin(matrix, axis=0)
+        max_vals = np.nanmax(matrix, axis=0)
+        constant = max_vals == min_vals
+        ranges = np.where(constant, 1.0, max_vals - min_vals)
+
+        normalized = (matrix - min_vals) / ranges
+        # 모든 값이 동일한 컬럼은 0.5
+        normalized[:, constant] = 0.5
+
+        for i, col in enumerate(columns):
+            df[f"{col}_norm"] = normalized[:, i]
 
         # 가중 평균 계산
-        df[output_col] = sum(
-            df[norm_col] * weight
-            for norm_col, weight in zip(normalized_cols, weights)
-        )
+        df[output_col] = normalized @ np.asarray(weights, dtype=np.float64)
 
         return df
 
@@ -154,13 +233,17 @@ class ScoreCalculator:
             ... )
             >>> print(score)  # 8.05
         """
-        # 각 지표의 점수 × 가중치 합산
-        weighted_score = 0.0
+        metrics, weight_array = _compile_weights(tuple(weights.items()))
+
+        # scores에 없는 지표는 0점으로 처리 (가중치 합산에서 제외와 동일)
+        score_array = np.fromiter(
+            (scores.get(metric, 0.0) for metric in metrics),
+            dtype=np.float64,
+            count=len(metrics)
+        )
 
-        for metric, weight in weights.items():
-            # weights에 없는 지표는 무시
-            if metric in scores:
-                weighted_score += scores[metric] * weight
+        # 각 지표의 점수 × 가중치 합산
+        weighted_score = float(score_array @ weight_array)
 
         return round(weighted_score, 2)
 
@@ -184,28 +267,38 @@ class ScoreCalculator:
             >>> ranked = ScoreCalculator.rank_normalize(values, ascending=True)
             >>> print(ranked)  # [0.0, 1.0, 0.5, 0.75, 0.25]
         """
-        # 순위 계산 (rank())
-        ranks = values.rank(method='min', ascending=ascending)
-
         # (순위 - 1) / (N - 1)로 0-1 정규화
         n = len(values)
         if n <= 1:
             return pd.Series(0.5, index=values.index)
 
-        normalized = (ranks - 1) / (n - 1)
-        return normalized
+        arr = _to_float_array(values)
+        if not ascending:
+            arr = -arr
+
+        # 정렬 배열에서 왼쪽 삽입 위치 = 자신보다 작은 값의 개수 = rank(method='min') - 1
+        ranks = np.searchsorted(np.sort(arr), arr, side='left').astype(np.float64)
+        ranks[np.isnan(arr)] = np.nan
+
+        return pd.Series(ranks / (n - 1), index=values.index, name=values.name)
 
     @staticmethod
     def percentile_rank(
         values: pd.Series,
-        value: float
+        value: float,
+        *,
+        sorted_values: Optional[np.ndarray] = None
     ) -> float:
         """
         특정 값의 백분위 순위 계산
 
+        같은 분포에 대해 여러 값을 조회할 때는 np.sort로 미리 정렬한 배열을
+        sorted_values로 넘기면 정렬 없이 이진 탐색만 수행합니다.
+
         Args:
             values: 값 분포
             value: 순위를 계산할 값
+            sorted_values: values를 오름차순 정렬한 배열 (선택)
 
         Returns:
             백분위 순위 (0-100)
@@ -215,13 +308,18 @@ class ScoreCalculator:
             >>> percentile = ScoreCalculator.percentile_rank(values, 35)
             >>> print(percentile)  # 70.0 (상위 30%)
         """
-        # value보다 작거나 같은 값의 비율 계산
-        count_below = (values <= value).sum()
+        if sorted_values is None:
+            sorted_values = np.sort(_to_float_array(values))
 
-        # (count(values <= value) / len(values)) × 100
-        percentile = (count_below / len(values)) * 100
+        n = sorted_values.size
+        if n == 0:
+            return float('nan')
 
-        return float(percentile)
+        # value보다 작거나 같은 값의 개수 (이진 탐색, NaN은 정렬 시 맨 뒤로 가므로 제외됨)
+        count_below = 0 if np.isnan(value) else np.searchsorted(sorted_values, value, side='right')
+
+        # (count(values <= value) / len(values)) × 100
+        return float(count_below / n * 100)
 
     @staticmethod
     def sigmoid_normalize(
@@ -246,9 +344,13 @@ class ScoreCalculator:
             >>> values = pd.Series([-2, -1, 0, 1, 2])
             >>> normalized = ScoreCalculator.sigmoid_normalize(values)
         """
-        # 1 / (1 + exp(-steepness × (values - midpoint)))
-        sigmoid = 1 / (1 + np.exp(-steepness * (values - midpoint)))
-        return sigmoid
+        # 1 / (1 + exp(-steepness × (values - midpoint))), 출력 버퍼 하나에서 in-place 계산
+        out = np.subtract(_to_float_array(values), midpoint)
+        np.multiply(out, -steepness, out=out)
+        np.exp(out, out=out)
+        np.add(out, 1.0, out=out)
+        np.reciprocal(out, out=out)
+        return pd.Series(out, index=values.index, name=values.name)
 
     @staticmethod
     def log_normalize(
@@ -270,16 +372,15 @@ class ScoreCalculator:
             >>> log_values = ScoreCalculator.log_normalize(values, base=10)
             >>> print(log_values)  # [0, 1, 2, 3]
         """
-        # 0 이하 값 처리 (작은 양수로 대체)
-        values_positive = values.clip(lower=1e-10)
+        # 0 이하 값 처리 (작은 양수로 대체, float 버퍼라 정수 입력도 1e-10 유지)
+        out = np.maximum(_to_float_array(values), 1e-10)
 
         # log(values) / log(base)
-        if base == np.e:
-            log_values = np.log(values_positive)
-        else:
-            log_values = np.log(values_positive) / np.log(base)
+        np.log(out, out=out)
+        if base != np.e:
+            np.divide(out, np.log(base), out=out)
 
-        return log_values
+        return pd.Series(out, index=values.index, name=values.name)
 
     @staticmethod
     def clip_and_normalize(
@@ -304,17 +405,31 @@ class ScoreCalculator:
             >>> values = pd.Series([1, 2, 3, 4, 5, 100])  # 100은 이상치
             >>> normalized = ScoreCalculator.clip_and_normalize(values)
         """
-        # 백분위수 계산
-        lower_bound = values.quantile(lower_percentile / 100.0)
-        upper_bound = values.quantile(upper_percentile / 100.0)
+        arr = _to_float_array(values).copy()
+        valid = arr[~np.isnan(arr)]
+        n = valid.size
+        if n == 0:
+            return pd.Series(np.nan, index=values.index, name=values.name)
 
-        # 값 clipping
-        clipped = values.clip(lower=lower_bound, upper=upper_bound)
+        # 백분위수 위치 (pandas quantile과 동일한 선형 보간)
+        pos = np.array([lower_percentile, upper_percentile]) / 100.0 * (n - 1)
+        below = np.floor(pos).astype(np.int64)
+        above = np.minimum(below + 1, n - 1)
 
-        # Min-Max 정규화
-        normalized = ScoreCalculator.min_max_normalize(clipped)
+        # 전체 정렬 대신 필요한 순서 통계량만 선택 (O(N))
+        part = np.partition(valid, np.unique(np.concatenate((below, above))))
+        lower_bound, upper_bound = part[below] + (part[above] - part[below]) * (pos - below)
 
-        return normalized
+        # 모든 값이 동일한 경우
+        if upper_bound == lower_bound:
+            return pd.Series(0.5, index=values.index, name=values.name)
+
+        # clipping 후 최소/최대는 각각 lower/upper bound이므로 같은 버퍼에서 Min-Max 정규화
+        np.clip(arr, lower_bound, upper_bound, out=arr)
+        np.subtract(arr, lower_bound, out=arr)
+        np.divide(arr, upper_bound - lower_bound, out=arr)
+
+        return pd.Series(arr, index=values.index, name=values.name)
 
     @staticmethod
     def scale_to_range(
@@ -378,12 +493,12 @@ class ScoreCalculator:
             >>> # 부채비율이 낮을수록 점수가 높음
         """
         # Min-Max 정규화
-        normalized = ScoreCalculator.min_max_normalize(values)
+        out = _min_max_kernel(_to_float_array(values), 0.0, 1.0)
 
-        # 1 - normalized (역전)
-        inverse = 1 - normalized
+        # 1 - normalized (역전, 같은 버퍼에서 in-place)
+        np.subtract(1.0, out, out=out)
 
-        return inverse
+        return pd.Series(out, index=values.index, name=values.name)
 
     @staticmethod
     def robust_normalize(
@@ -404,19 +519,6 @@ class ScoreCalculator:
             >>> values = pd.Series([1, 2, 3, 4, 5, 100])  # 100은 이상치
             >>> normalized = ScoreCalculator.robust_normalize(values)
         """
-        # 중앙값(median) 계산
-        median = values.median()
-
-        # IQR = Q3 - Q1 계산
-        q1 = values.quantile(0.25)
-        q3 = values.quantile(0.75)
-        iqr = q3 - q1
-
-        # IQR == 0인 경우 처리 (모든 값이 동일)
-        if iqr == 0 or np.isnan(iqr):
-            return pd.Series(0.0, index=values.index)
-
-        # (values - median) / IQR
-        robust = (values - median) / iqr
-
-        return robust
+        # (values - median) / IQR, IQR == 0인 경우 모두 0 반환
+        robust = _robust_kernel(_to_float_array(values))
+        return pd.Series(robust, index=values.index, name=values.name)
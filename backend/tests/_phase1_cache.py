@@ -0,0 +1,88 @@
+"""
+Morning Report Phase 1 공용 헬퍼 (시장 스냅샷 + 재무 데이터 + 3개 점수 계산)
+
+test_top50_selection.py / test_sentiment_analysis.py가 같은 Phase 1 결과를 사용하므로
+날짜별로 data/.cache/에 저장해 두 번째 실행부터 재계산을 건너뜁니다.
+FinancialData가 캐시 이후 갱신되면 (max(updated_at) > 캐시 mtime) 다시 계산합니다.
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+from sqlalchemy import func
+
+from app.db.database import get_db
+from app.db.models import FinancialData
+
+CACHE_DIR = Path(__file__).parent.parent.parent / "data" / ".cache"
+
+
+def _financial_data_updated_at():
+    """FinancialData 최종 갱신 시각"""
+    with get_db() as db:
+        return db.query(func.max(FinancialData.updated_at)).scalar()
+
+
+def _is_fresh(cache_path: Path) -> bool:
+    """캐시 파일이 존재하고 FinancialData 갱신 이후에 생성되었는지 확인"""
+    if not cache_path.exists():
+        return False
+
+    updated_at = _financial_data_updated_at()
+    if updated_at is None:
+        return True
+
+    return datetime.fromtimestamp(cache_path.stat().st_mtime) >= updated_at
+
+
+async def load_phase1_scores(report_service, test_date: datetime) -> pd.DataFrame:
+    """
+    Phase 1 점수 계산 결과 조회 (캐시 우선)
+
+    Args:
+        report_service: LLMReport 인스턴스
+        test_date: 기준 날짜
+
+    Returns:
+        momentum_score / volume_score / technical_score가 계산된 전체 종목 DataFrame
+    """
+    cache_path = CACHE_DIR / f"phase1_scores_{test_date.strftime('%Y%m%d')}.pkl"
+
+    if _is_fresh(cache_path):
+        df = pd.read_pickle(cache_path)
+        print(f"[Phase 1] 캐시 사용: {cache_path} ({len(df)}개 종목)")
+        print()
+        return df
+
+    # 1.1: 시장 스냅샷 + DB 데이터 조회
+    print("[Step 1.1] 시장 스냅샷 + DB 데이터 조회")
+    df_market = await report_service.data_service.get_market_snapshot(test_date)
+    print(f"  - 시장 스냅샷: {len(df_market)}개 종목")
+
+    with get_db() as db:
+        df_financial = pd.read_sql(db.query(FinancialData).statement, db.connection())
+    print(f"  - DB 조회: {len(df_financial)}개 종목")
+
+    df = df_market.merge(df_financial, on='ticker', how='inner')
+    print(f"  - Merge: {len(df)}개 종목")
+
+    # 유효성 검증
+    df = df[
+        (df['per'] > 0) &
+        (df['pbr'] > 0) &
+        (df['market_cap'] > 0) &
+        (df['종가'] > 0)
+    ].copy()
+    print(f"  - 유효성 검증 후: {len(df)}개 종목")
+    print()
+
+    # 1.2-1.4: 3개 점수 계산
+    print("[Step 1.2-1.4] 3개 점수 계산 (Momentum, Volume, Technical)")
+    df = await report_service._calculate_all_scores(df, test_date)
+    print()
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    df.to_pickle(cache_path)
+
+    return df
@@ -0,0 +1,289 @@
+"""
+공용 pytest fixture
+
+여러 테스트 모듈에서 공유하는 읽기 전용 fixture
+"""
+
+import os
+import sys
+import copy
+import json
+import shutil
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+import pytest_asyncio
+import pandas as pd
+import numpy as np
+from freezegun import freeze_time
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# 리포트 테스트 기준 시각 (2025-11-14 금, 장 마감 리포트 생성 15:40 이후)
+FROZEN_NOW = datetime(2025, 11, 14, 16, 0)
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "llm_integration: 실제 Gemini API를 호출하는 통합 테스트 (시간 소요, 비용 발생)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """llm_integration 테스트는 RUN_LLM_TESTS가 설정된 경우에만 실행 (기본 skip)"""
+    if os.getenv("RUN_LLM_TESTS"):
+        return
+
+    skip_llm = pytest.mark.skip(reason="실제 LLM 호출 테스트 (RUN_LLM_TESTS=1로 실행)")
+    for item in items:
+        if item.get_closest_marker("llm_integration"):
+            item.add_marker(skip_llm)
+
+
+@pytest.fixture(scope="module")
+def worker_db(tmp_path_factory):
+    """
+    워커별 DB 생성 (실제 DB가 필요한 테스트 모듈만 요청)
+
+    data/mint.db가 있으면 임시 디렉토리의 워커별 파일(mint_{worker_id}.db)로 복사하고,
+    app.db.database의 engine / SessionLocal을 그 파일로 교체한 뒤 테이블을 생성합니다.
+    pytest-xdist 워커끼리 같은 DB 파일을 두고 잠금 충돌을 일으키지 않으며,
+    요청하지 않은 테스트 실행에서는 data/mint.db를 만들지 않습니다.
+    (module 단위로 교체 후 복원하므로 client fixture의 in-memory DB를 덮어쓰지 않음)
+
+    Example:
+        >>> pytestmark = pytest.mark.usefixtures("worker_db")  # 테스트 모듈 상단
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from app.db import database
+
+    # pytest-xdist 워커 ID (gw0, gw1, ...), xdist 미사용 / 미설치 시 master
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    db_path = tmp_path_factory.mktemp("db") / f"mint_{worker_id}.db"
+    if database.DB_PATH.exists():
+        shutil.copyfile(database.DB_PATH, db_path)
+
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False}
+    )
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(database, "engine", engine)
+        mp.setattr(
+            database, "SessionLocal",
+            sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        )
+        database.init_db()
+        yield engine
+
+    engine.dispose()
+
+
+def load_fixture(name: str) -> dict:
+    """tests/fixtures/{name}.json 로드"""
+    with open(FIXTURES_DIR / f"{name}.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def sample_prices():
+    """
+    테스트용 샘플 가격 시계열 (60일)
+
+    세션 단위로 한 번만 메모리에서 생성합니다. (테스트에서 읽기 전용으로만 사용)
+    """
+    np.random.seed(42)
+    base_price = 50000
+    returns = np.random.normal(0.001, 0.02, 60)  # 평균 0.1%, 표준편차 2%
+    prices = [base_price]
+
+    for ret in returns:
+        prices.append(prices[-1] * (1 + ret))
+
+    return pd.Series(prices)
+
+
+@pytest.fixture
+def mock_llm_report(request, monkeypatch):
+    """
+    리포트 생성 경로의 Gemini / KRX 호출을 fixture 응답으로 대체
+
+    - LLMReport.generate_morning_report → tests/fixtures/morning_report.json (date만 요청 날짜로 교체)
+    - LLMReport.generate_afternoon_report → tests/fixtures/afternoon_report.json
+    - DataService.get_market_index → tests/fixtures/market_index.json
+
+    llm_integration 마커가 붙은 테스트는 대체하지 않고 실제 API를 호출합니다.
+    """
+    if request.node.get_closest_marker("llm_integration"):
+        yield
+        return
+
+    from app.services.llm_report import LLMReport
+    from app.services.data_service import DataService
+
+    morning = load_fixture("morning_report")
+    afternoon = load_fixture("afternoon_report")
+    market_index = load_fixture("market_index")
+
+    # GEMINI_API_KEY 없이도 인스턴스 생성 가능하도록 초기화 생략
+    monkeypatch.setattr(LLMReport, "__init__", lambda self: None)
+    monkeypatch.setattr(
+        LLMReport, "generate_morning_report",
+        AsyncMock(side_effect=lambda date: {**copy.deepcopy(morning), "date": date.strftime("%Y-%m-%d")})
+    )
+    monkeypatch.setattr(
+        LLMReport, "generate_afternoon_report",
+        AsyncMock(side_effect=lambda *args, **kwargs: copy.deepcopy(afternoon))
+    )
+    monkeypatch.setattr(
+        DataService, "get_market_index",
+        AsyncMock(side_effect=lambda *args, **kwargs: copy.deepcopy(market_index))
+    )
+    yield
+
+
+@pytest.fixture(scope="session")
+def test_engine():
+    """테스트용 in-memory SQLite 엔진 (StaticPool로 세션 동안 단일 커넥션 공유)"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import StaticPool
+    from app.db.models import Base
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def client(test_engine):
+    """
+    모듈 단위 공용 TestClient
+
+    엔드포인트가 Depends 대신 get_db()를 직접 호출하므로, dependency_overrides 대신
+    app.db.database의 engine / SessionLocal을 in-memory 엔진으로 교체합니다.
+    교체는 이 fixture를 요청한 모듈이 끝나면 복원되므로, 이후 모듈은
+    다시 data/mint.db를 사용합니다. (in-memory 엔진과 시드 데이터는 세션 동안 유지)
+    """
+    from fastapi.testclient import TestClient
+    from sqlalchemy.orm import sessionmaker
+    from app.db import database
+    from app.main import app
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(database, "engine", test_engine)
+        mp.setattr(
+            database, "SessionLocal",
+            sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+        )
+        yield TestClient(app)
+
+
+@pytest_asyncio.fixture
+async def async_client(client):
+    """
+    ASGI 앱을 직접 호출하는 httpx.AsyncClient
+
+    client fixture와 같은 앱 / in-memory DB를 사용하며, async 테스트에서
+    이벤트 루프를 막지 않고 요청을 보낼 때 사용합니다.
+    """
+    from httpx import AsyncClient, ASGITransport
+
+    async with AsyncClient(
+        transport=ASGITransport(app=client.app),
+        base_url="http://testserver",
+        follow_redirects=True  # TestClient와 동일하게 리다이렉트 추적
+    ) as ac:
+        yield ac
+
+
+@pytest.fixture(scope="module")
+def frozen_today():
+    """
+    현재 시각을 FROZEN_NOW로 고정하고 날짜 문자열(YYYY-MM-DD) 반환
+
+    엔드포인트의 datetime.now() 기본값과 seeded_reports 날짜가 항상 일치합니다.
+    (tick=True: 이벤트 루프가 멈추지 않도록 고정 시점부터 시간은 흐름)
+    """
+    with freeze_time(FROZEN_NOW, tick=True):
+        yield FROZEN_NOW.strftime("%Y-%m-%d")
+
+
+@pytest.fixture(scope="session")
+def seeded_reports(test_engine):
+    """
+    리포트 조회 테스트용 데이터 직접 삽입 (setup용 generate POST 대체)
+
+    - FROZEN_NOW 날짜의 장 시작 / 장 마감 리포트
+    """
+    from sqlalchemy.orm import Session
+    from app.db.models import ReportResult
+    from app.models.report import MorningReport, AfternoonReport, ExtendedMarketSummary
+
+    now = FROZEN_NOW
+    today = now.strftime("%Y-%m-%d")
+
+    morning = load_fixture("morning_report")
+    afternoon = load_fixture("afternoon_report")
+    market_index = load_fixture("market_index")
+
+    market_summary = ExtendedMarketSummary(
+        kospi_close=market_index["kospi_close"],
+        kospi_change=market_index["kospi_change"],
+        kosdaq_close=market_index["kosdaq_close"],
+        kosdaq_change=market_index["kosdaq_change"]
+    )
+
+    reports = [
+        MorningReport(**{**morning, "date": today}),
+        AfternoonReport(
+            **afternoon, date=today, market_summary=market_summary,
+            surge_stocks=afternoon["surge_analysis"]
+        ),
+    ]
+
+    with Session(test_engine) as db:
+        db.add_all([
+            ReportResult(
+                report_type=report.report_type,
+                date=report.date,
+                content=report.model_dump_json(),
+                generated_at=now,
+                model_name="gemini-2.5-flash",
+                tokens_used=report.metadata.get("tokens_used", 0)
+            )
+            for report in reports
+        ])
+        db.commit()
+
+    return reports
+
+
+@pytest.fixture(scope="session")
+def seeded_stocks(test_engine):
+    """
+    종목 조회 / 검색 테스트용 재무 데이터 직접 삽입
+
+    - tests/fixtures/financial_data.json (삼성전자 등 KOSPI / KOSDAQ 종목)
+    """
+    from sqlalchemy.orm import Session
+    from app.db.models import FinancialData
+
+    rows = load_fixture("financial_data")
+
+    with Session(test_engine) as db:
+        db.add_all([FinancialData(**row, updated_at=FROZEN_NOW) for row in rows])
+        db.commit()
+
+    return rows
@@ -2,10 +2,10 @@
 Analysis API 통합 테스트
 
 pytest backend/tests/test_analysis_api.py -v
-pytest backend/tests/test_analysis_api.py -v -m llm_integration  # LLM 호출 테스트만
+RUN_LLM_TESTS=1 pytest backend/tests/test_analysis_api.py -v -m llm_integration  # LLM 호출 테스트만
 
 주의:
-- @pytest.mark.llm_integration: 실제 LLM 호출 (시간 소요, 비용 발생)
+- @pytest.mark.llm_integration: 실제 LLM 호출 (시간 소요, 비용 발생, RUN_LLM_TESTS 미설정 시 skip)
 - 캐시는 DB 기반
 """
 
@@ -23,6 +23,8 @@ import time
 
 from app.main import app
 
+pytestmark = pytest.mark.usefixtures("worker_db")
+
 client = TestClient(app)
 
 
@@ -19,6 +19,8 @@ from app.services.analysis_service import AnalysisService
 from app.services.data_service import DataService
 from app.models.analysis import Analysis, FinancialData, NewsData, TechnicalData
 
+pytestmark = pytest.mark.usefixtures("worker_db")
+
 # 테스트 기준일: 11월 14일 (11월 15일은 휴장일)
 TEST_DATE = datetime(2025, 11, 14)
 
@@ -8,7 +8,11 @@ from datetime import datetime
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from app.utils.llm_utils import deduplicate_news
+import numpy as np
+import pytest
+
+from app.utils import llm_utils
+from app.utils.llm_utils import deduplicate_news, deduplicate_news_batch
 
 
 def test_multiple_thresholds():
@@ -137,5 +141,62 @@ def test_multiple_thresholds():
     print()
 
 
+class _FakeSentenceModel:
+    """제목 첫 글자로 임베딩을 만드는 가짜 STS 모델 (같은 첫 글자 = 중복)"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, titles, batch_size=32, convert_to_numpy=True, show_progress_bar=False):
+        self.calls += 1
+        return np.array([np.eye(64)[ord(t[0]) % 64] for t in titles])
+
+
+def test_deduplicate_news_batch_matches_single(monkeypatch):
+    """배치 중복 제거 결과가 종목별 deduplicate_news()와 동일하고 encode는 1회만 호출"""
+    pytest.importorskip("sklearn")
+
+    model = _FakeSentenceModel()
+    monkeypatch.setattr(llm_utils, "get_sentence_model", lambda: model)
+
+    news_lists = [
+        [{'title': '가격 상승'}, {'title': '가격 급등'}, {'title': '다른 뉴스'}],
+        [],
+        [{'title': '나스닥'}, {'title': '라면'}],
+    ]
+
+    batched = deduplicate_news_batch(news_lists, threshold=0.999)
+    assert model.calls == 1
+
+    expected = [deduplicate_news(news_list, threshold=0.999) for news_list in news_lists]
+    assert batched == expected
+    assert [news['title'] for news in batched[0]] == ['가격 상승', '다른 뉴스']
+
+
+def test_get_sentence_model_retries_after_failure(monkeypatch):
+    """모델 로드 실패(None)는 보관하지 않고 다음 호출에서 재시도, 성공한 모델은 재사용"""
+    import types
+
+    attempts = []
+
+    def _fake_sentence_transformer(name):
+        attempts.append(name)
+        if len(attempts) == 1:
+            raise OSError("model download failed")
+        return _FakeSentenceModel()
+
+    fake_module = types.ModuleType("sentence_transformers")
+    fake_module.SentenceTransformer = _fake_sentence_transformer
+    monkeypatch.setitem(sys.modules, "sentence_transformers", fake_module)
+    monkeypatch.setattr(llm_utils, "_sentence_model", None)
+
+    assert llm_utils.get_sentence_model() is None
+
+    model = llm_utils.get_sentence_model()
+    assert isinstance(model, _FakeSentenceModel)
+    assert llm_utils.get_sentence_model() is model
+    assert len(attempts) == 2
+
+
 if __name__ == "__main__":
     test_multiple_thresholds()
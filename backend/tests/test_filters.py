@@ -123,6 +123,14 @@ class TestStockFilter:
         assert len(result) == 3  # A001, A002, A006
         assert all(result['sector'].isin(['반도체', 'IT서비스']))
 
+    def test_filter_by_sector_categorical(self, sample_df):
+        """categorical 업종 컬럼 필터 테스트"""
+        sample_df['sector'] = sample_df['sector'].astype('category')
+        result = StockFilter.filter_by_sector(sample_df, sectors=['반도체', 'IT서비스', '없는업종'])
+
+        assert len(result) == 3  # A001, A002, A006
+        assert all(result['sector'].isin(['반도체', 'IT서비스']))
+
     def test_filter_by_price_range(self, sample_df):
         """가격대 필터 테스트"""
         # 최소가만
@@ -193,6 +201,23 @@ class TestStockFilter:
             ~result['name'].str.contains('관리|정리|거래정지', na=False)
         )  # 관리종목 제외
 
+    def test_combine_filters_lazy_expr(self, sample_df):
+        """지연 평가 표현식 필터 조합 테스트"""
+        exprs = [
+            StockFilter.uptrend_expr(),
+            StockFilter.intraday_rise_expr(min_rise_rate=3.0),
+        ]
+
+        result = StockFilter.combine_filters(sample_df, exprs)
+
+        # 순차 적용 결과와 동일해야 함
+        expected = StockFilter.filter_by_intraday_rise(
+            StockFilter.filter_uptrend_only(sample_df),
+            min_rise_rate=3.0
+        )
+        assert list(result['ticker']) == list(expected['ticker'])
+        assert all(result['종가'] > result['시가'])
+
     def test_empty_dataframe_handling(self, sample_df):
         """빈 데이터프레임 처리 테스트"""
         # 모든 종목이 필터링된 경우 빈 데이터프레임 반환
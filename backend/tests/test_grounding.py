@@ -2,6 +2,8 @@
 Google Grounding 기능 테스트
 
 LLMReport 서비스의 Google Search Grounding 기능을 테스트합니다.
+
+RUN_LLM_TESTS=1 pytest backend/tests/test_grounding.py -v   # 실제 Gemini 호출 (시간 소요, 비용 발생)
 """
 
 import asyncio
@@ -9,13 +11,33 @@ import sys
 import os
 from datetime import datetime
 
+import pytest
+import pytest_asyncio
+
 # 프로젝트 루트를 sys.path에 추가
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from app.services.llm_report import LLMReport
 
+# 실제 Gemini API 호출 (RUN_LLM_TESTS 미설정 시 skip), 세션 fixture와 같은 이벤트 루프 사용
+pytestmark = [pytest.mark.llm_integration, pytest.mark.asyncio(loop_scope="session")]
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def llm_service():
+    """
+    세션 단위로 공유하는 LLMReport 인스턴스
+
+    Gemini 클라이언트, rate limiter, cost_tracker를 테스트 간 재사용합니다.
+    """
+    print("🔧 LLMReport 서비스 초기화 중...")
+    service = LLMReport()
+    print("✅ LLMReport 초기화 완료")
+    print()
+    yield service
+
 
-async def test_grounding():
+async def test_grounding(llm_service: LLMReport):
     """
     Google Grounding 기능 통합 테스트
 
@@ -30,11 +52,7 @@ async def test_grounding():
     print("=" * 80)
     print()
 
-    # 서비스 초기화
-    print("🔧 LLMReport 서비스 초기화 중...")
-    service = LLMReport()
-    print("✅ LLMReport 초기화 완료")
-    print()
+    service = llm_service
 
     # 테스트 프롬프트 (시장 분석용)
     test_prompt = """
@@ -118,7 +136,7 @@ async def test_grounding():
     return True
 
 
-async def test_basic_generation():
+async def test_basic_generation(llm_service: LLMReport):
     """
     기본 텍스트 생성 테스트 (Grounding 없음)
 
@@ -130,7 +148,7 @@ async def test_basic_generation():
     print("=" * 80)
     print()
 
-    service = LLMReport()
+    service = llm_service
 
     test_prompt = "2025년 11월 13일 글로벌 금융시장 동향을 간략히 요약하세요."
 
@@ -145,7 +163,7 @@ async def test_basic_generation():
 
         # 비용 정보
         cost_report = service.cost_tracker.get_daily_report()
-        print("💰 비용:")
+        print("💰 비용 (세션 누적):")
         print(f"   ${cost_report['total_cost_usd']:.4f} (Grounding 비용 없음)")
         print()
 
@@ -164,11 +182,17 @@ async def main():
     print("╚" + "=" * 78 + "╝")
     print()
 
+    # 서비스 초기화 (두 테스트에서 공유)
+    print("🔧 LLMReport 서비스 초기화 중...")
+    service = LLMReport()
+    print("✅ LLMReport 초기화 완료")
+    print()
+
     # Test 1: Grounding 기능
-    success1 = await test_grounding()
+    success1 = await test_grounding(service)
 
     # Test 2: 기본 생성 (비교용)
-    success2 = await test_basic_generation()
+    success2 = await test_basic_generation(service)
 
     # 최종 결과
     print()
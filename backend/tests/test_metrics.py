@@ -16,21 +16,7 @@ import numpy as np
 from app.utils.metrics import MetricsCalculator
 
 
-@pytest.fixture
-def sample_prices():
-    """테스트용 샘플 가격 시계열 (60일)"""
-    np.random.seed(42)
-    base_price = 50000
-    returns = np.random.normal(0.001, 0.02, 60)  # 평균 0.1%, 표준편차 2%
-    prices = [base_price]
-
-    for ret in returns:
-        prices.append(prices[-1] * (1 + ret))
-
-    return pd.Series(prices)
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_df():
     """테스트용 샘플 데이터프레임"""
     return pd.DataFrame({
@@ -123,6 +109,23 @@ class TestMetricsCalculator:
         # 또는 반대 (하락 추세인 경우)
         assert isinstance(mas[5], float)
 
+    def test_calculate_moving_averages_batch(self, sample_prices):
+        """이동평균 일괄 계산 테스트"""
+        prices_2d = np.vstack([sample_prices.to_numpy(), sample_prices.to_numpy() * 2])
+
+        mas = MetricsCalculator.calculate_moving_averages_batch(prices_2d, periods=(5, 20, 60))
+
+        # 종목별 결과가 단일 계산과 일치
+        single = MetricsCalculator.calculate_moving_averages(sample_prices, periods=[5, 20, 60])
+        for period in (5, 20, 60):
+            assert mas[period].shape == (2,)
+            assert np.isclose(mas[period][0], single[period])
+            assert np.isclose(mas[period][1], single[period] * 2)
+
+        # 데이터 부족 시 0.0
+        short = MetricsCalculator.calculate_moving_averages_batch(prices_2d[:, :3], periods=(5,))
+        assert np.all(short[5] == 0.0)
+
     def test_calculate_gap_ratio(self, sample_df, sample_prev_df):
         """갭 상승률 계산 테스트"""
         gap_ratio = MetricsCalculator.calculate_gap_ratio(sample_df, sample_prev_df)
@@ -11,6 +11,8 @@ Morning Report 생성 테스트
 Usage:
     cd backend && python tests/test_morning_report.py
     cd backend && python tests/test_morning_report.py --date 2025-12-03
+    cd backend && MINT_LLM_CACHE=1 python tests/test_morning_report.py  # LLM 응답 캐시 사용
+    cd backend && python tests/test_morning_report.py --no-cache
 """
 
 import asyncio
@@ -18,18 +20,48 @@ import sys
 import argparse
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 import json
 
 # 프로젝트 루트를 sys.path에 추가
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from app.core.config import settings
 from app.services.llm_report import LLMReport
 from app.db.database import init_db
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+# 출력 구분선
+SEP = "=" * 80
+SUB = "-" * 80
+DIV = "─" * 78
+
+
+def _dumps_report(report: dict) -> bytes:
+    """리포트 JSON 직렬화 (orjson 사용 가능 시 orjson, 없으면 json) → UTF-8 bytes"""
+    if orjson is not None:
+        return orjson.dumps(
+            report,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            default=str
+        )
+    return json.dumps(report, ensure_ascii=False, indent=2, default=str).encode('utf-8')
+
+
+@lru_cache(maxsize=1)
+def _init_db_once():
+    """DB 초기화 (프로세스당 한 번만 실행)"""
+    init_db()
+
+
+@lru_cache(maxsize=128)
 def get_confidence_label(confidence: float) -> str:
-    """Confidence 값을 라벨로 변환"""
+    """Confidence 값을 라벨로 변환 (LLM 신뢰도는 몇 가지 값으로 반복되므로 캐싱)"""
     if confidence >= 0.8:
         return f"🟢 HIGH ({confidence:.0%})"
     elif confidence >= 0.6:
@@ -40,13 +72,13 @@ def get_confidence_label(confidence: float) -> str:
 
 async def test_morning_report(test_date: datetime):
     """Morning Report 생성 테스트"""
-    print("=" * 80)
+    print(SEP)
     print("Morning Report 생성 테스트 시작")
-    print("=" * 80)
+    print(SEP)
     print()
 
-    # DB 초기화
-    init_db()
+    # DB 초기화 (같은 프로세스에서 재호출 시 생략)
+    _init_db_once()
 
     # LLMReport 서비스 생성
     report_service = LLMReport()
@@ -56,98 +88,99 @@ async def test_morning_report(test_date: datetime):
 
     try:
         # ========== Phase 1: Top 10 종목 선정 ==========
-        print("=" * 80)
+        print(SEP)
         print("[Phase 1] Top 10 종목 선정...")
-        print("=" * 80)
+        print(SEP)
         top_10_stocks = await report_service.select_top_stocks_for_morning(test_date, top_n=10)
         print(f"선정된 종목 수: {len(top_10_stocks)}")
         for i, stock in enumerate(top_10_stocks, 1):
             print(f"  {i}. {stock['name']} ({stock['ticker']}) - 점수: {stock['final_score']:.2f}")
         print()
 
-        # ========== Phase 2: 시장 데이터 수집 ==========
-        print("=" * 80)
+        # ========== Phase 2 ~ 2.6: 시장 데이터 / realtime_prices / ATR 동시 수집 ==========
+        # 세 단계는 서로 독립적인 I/O 호출이므로 asyncio.gather로 병렬 실행
+        tickers = [stock['ticker'] for stock in top_10_stocks]
+        market_data, realtime_prices, atr_data = await asyncio.gather(
+            report_service._collect_market_data(test_date),
+            report_service.data_service.get_realtime_prices_bulk(tickers, staleness_threshold=86400),
+            report_service.data_service.get_atr_batch(tickers, test_date, period=14)
+        )
+
+        print(SEP)
         print("[Phase 2] 시장 데이터 수집...")
-        print("=" * 80)
-        market_data = await report_service._collect_market_data(test_date)
+        print(SEP)
         print(f"KOSPI 종가: {market_data.get('kospi_close')}")
         print(f"KOSPI 등락률: {market_data.get('kospi_change')}%")
         print()
 
-        # ========== Phase 2.5: realtime_prices 조회 ==========
-        print("=" * 80)
+        print(SEP)
         print("[Phase 2.5] realtime_prices 조회...")
-        print("=" * 80)
-        tickers = [stock['ticker'] for stock in top_10_stocks]
-        realtime_prices = await report_service.data_service.get_realtime_prices_bulk(tickers, staleness_threshold=86400)
+        print(SEP)
         for ticker, rt in realtime_prices.items():
             if rt:
                 print(f"  {ticker}: {rt.get('current_price'):,}원 ({rt.get('change_rate'):+.2f}%)")
         print()
 
-        # ========== Phase 2.6: ATR 계산 ==========
-        print("=" * 80)
+        print(SEP)
         print("[Phase 2.6] ATR 계산...")
-        print("=" * 80)
-        atr_data = await report_service.data_service.get_atr_batch(tickers, test_date, period=14)
+        print(SEP)
         for ticker, atr in atr_data.items():
             if atr:
                 print(f"  {ticker}: ATR {atr:,.0f}원")
         print()
 
         # Top 10에 realtime_prices + ATR 병합
-        for stock in top_10_stocks:
-            ticker = stock['ticker']
-            if ticker in realtime_prices and realtime_prices[ticker]:
-                stock['realtime_price'] = realtime_prices[ticker]
-            else:
-                stock['realtime_price'] = None
-            stock['atr'] = atr_data.get(ticker)
-            if stock['atr'] and stock.get('realtime_price'):
-                current_price = stock['realtime_price'].get('current_price', 0)
-                if current_price > 0:
-                    stock['atr_percent'] = round(stock['atr'] / current_price * 100, 2)
+        report_service._merge_rt_atr(top_10_stocks, realtime_prices, atr_data)
 
         # ========== Phase 3: 프롬프트 생성 ==========
-        print("=" * 80)
+        print(SEP)
         print("[Phase 3] 프롬프트 생성")
-        print("=" * 80)
+        print(SEP)
         prompt = report_service._build_morning_report_prompt(test_date, market_data, top_10_stocks)
         print()
         print(">>> 프롬프트 전문 <<<")
-        print("-" * 80)
-        print(prompt)
-        print("-" * 80)
-        print(f"프롬프트 길이: {len(prompt):,} 문자")
+        print(SUB)
+        # 프롬프트는 수만 자에 달하므로 print 포맷팅을 거치지 않고 그대로 기록
+        prompt_len = len(prompt)
+        sys.stdout.write(prompt)
+        sys.stdout.write('\n')
+        print(SUB)
+        print(f"프롬프트 길이: {prompt_len:,} 문자")
         print()
 
         # ========== Phase 4: LLM 호출 ==========
-        print("=" * 80)
+        print(SEP)
         print("[Phase 4] LLM 호출 (Google Search Grounding)...")
-        print("=" * 80)
+        print(SEP)
         print("⏳ 약 1-2분 소요...")
         print()
 
         report = await report_service.generate_morning_report(test_date)
 
+        # JSON 직렬화는 한 번만 (이벤트 루프를 막지 않도록 스레드에서 실행, 출력/저장에 bytes 재사용)
+        payload = await asyncio.to_thread(_dumps_report, report)
+
         # ========== 전체 출력 (JSON) ==========
         print()
-        print("=" * 80)
+        print(SEP)
         print(">>> LLM 응답 전문 (JSON) <<<")
-        print("=" * 80)
-        print(json.dumps(report, ensure_ascii=False, indent=2, default=str))
+        print(SEP)
+        # bytes 그대로 기록 (print로 쌓인 텍스트 버퍼를 먼저 비워 순서 유지)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(payload)
+        sys.stdout.buffer.write(b'\n')
         print()
-        print("=" * 80)
+        print(SEP)
 
         # 결과 출력
-        print("=" * 80)
+        print(SEP)
         print("Morning Report 생성 완료!")
-        print("=" * 80)
+        print(SEP)
         print()
 
         # 1. 시장 전망
         print("[1] 시장 전망")
-        print("-" * 80)
+        print(SUB)
         print(report.get('market_forecast', 'N/A'))
         print()
 
@@ -162,38 +195,38 @@ async def test_morning_report(test_date: datetime):
         market_risks = report.get('market_risks', [])
         if market_risks:
             print("[3] 주요 리스크 요인")
-            print("-" * 80)
+            print(SUB)
             for i, risk in enumerate(market_risks, 1):
                 print(f"{i}. {risk}")
             print()
 
         # 4. Top 10 주목 종목 (상세 진입 전략)
-        print("[4] 주목 종목 Top 10 (상세 진입 전략)")
-        print("=" * 80)
+        # 종목당 출력 줄이 많아 리스트에 모은 뒤 한 번에 기록
+        lines = ["[4] 주목 종목 Top 10 (상세 진입 전략)", SEP]
         top_stocks = report.get('top_stocks', [])
         for stock_info in top_stocks[:10]:
-            print(f"\n{'─' * 78}")
-            print(f"#{stock_info.get('rank')} {stock_info.get('name')} ({stock_info.get('ticker')})")
-            print(f"{'─' * 78}")
-            print(f"   현재가: {stock_info.get('current_price', 0):,}원")
-            print(f"   주목 이유: {stock_info.get('reason', 'N/A')}")
+            lines.append(f"\n{DIV}")
+            lines.append(f"#{stock_info.get('rank')} {stock_info.get('name')} ({stock_info.get('ticker')})")
+            lines.append(DIV)
+            lines.append(f"   현재가: {stock_info.get('current_price', 0):,}원")
+            lines.append(f"   주목 이유: {stock_info.get('reason', 'N/A')}")
 
             # 진입 전략 상세 출력
             entry = stock_info.get('entry_strategy', {})
             if isinstance(entry, dict):
-                print("\n   📈 진입 전략:")
+                lines.append("\n   📈 진입 전략:")
 
                 # Chain-of-Thought Analysis (새로 추가)
                 if entry.get('analysis'):
-                    print(f"      📊 분석: {entry.get('analysis')}")
+                    lines.append(f"      📊 분석: {entry.get('analysis')}")
 
                 # Confidence (새로 추가)
                 if entry.get('confidence') is not None:
-                    print(f"      🎯 신뢰도: {get_confidence_label(entry.get('confidence'))}")
+                    lines.append(f"      🎯 신뢰도: {get_confidence_label(entry.get('confidence'))}")
 
-                print()
-                print(f"      진입가: {entry.get('entry_price', 0):,}원")
-                print(f"      진입 타이밍: {entry.get('entry_timing', 'N/A')}")
+                lines.append("")
+                lines.append(f"      진입가: {entry.get('entry_price', 0):,}원")
+                lines.append(f"      진입 타이밍: {entry.get('entry_timing', 'N/A')}")
 
                 entry_price = entry.get('entry_price', 1)
                 target1 = entry.get('target_price_1', 0)
@@ -205,63 +238,63 @@ async def test_morning_report(test_date: datetime):
                     gain2 = ((target2 / entry_price - 1) * 100) if target2 else 0
                     loss = ((stop_loss / entry_price - 1) * 100) if stop_loss else 0
 
-                    print(f"      1차 목표가: {target1:,}원 ({gain1:+.1f}%)")
-                    print(f"      2차 목표가: {target2:,}원 ({gain2:+.1f}%)")
-                    print(f"      손절가: {stop_loss:,}원 ({loss:+.1f}%)")
+                    lines.append(f"      1차 목표가: {target1:,}원 ({gain1:+.1f}%)")
+                    lines.append(f"      2차 목표가: {target2:,}원 ({gain2:+.1f}%)")
+                    lines.append(f"      손절가: {stop_loss:,}원 ({loss:+.1f}%)")
 
-                print(f"      손익비: {entry.get('risk_reward_ratio', 'N/A')}")
-                print(f"      보유기간: {entry.get('holding_period', 'N/A')}")
-                print(f"      기술적 근거: {entry.get('technical_basis', 'N/A')}")
-                print(f"      거래량 전략: {entry.get('volume_strategy', 'N/A')}")
-                print(f"      청산 조건: {entry.get('exit_condition', 'N/A')}")
+                lines.append(f"      손익비: {entry.get('risk_reward_ratio', 'N/A')}")
+                lines.append(f"      보유기간: {entry.get('holding_period', 'N/A')}")
+                lines.append(f"      기술적 근거: {entry.get('technical_basis', 'N/A')}")
+                lines.append(f"      거래량 전략: {entry.get('volume_strategy', 'N/A')}")
+                lines.append(f"      청산 조건: {entry.get('exit_condition', 'N/A')}")
             else:
-                print(f"   진입 전략: {entry}")
+                lines.append(f"   진입 전략: {entry}")
+        sys.stdout.write('\n'.join(lines) + '\n')
 
         # 5. 섹터 분석
-        print()
-        print("[5] 섹터 분석")
-        print("-" * 80)
+        lines = ["", "[5] 섹터 분석", SUB]
         sector_analysis = report.get('sector_analysis', {})
 
         bullish = sector_analysis.get('bullish', [])
         if bullish:
-            print("📈 강세 예상:")
+            lines.append("📈 강세 예상:")
             for sector_info in bullish:
                 if isinstance(sector_info, dict):
-                    print(f"   • {sector_info.get('sector')}: {sector_info.get('reason')}")
+                    lines.append(f"   • {sector_info.get('sector')}: {sector_info.get('reason')}")
                 else:
-                    print(f"   • {sector_info}")
+                    lines.append(f"   • {sector_info}")
 
         bearish = sector_analysis.get('bearish', [])
         if bearish:
-            print("\n📉 약세 예상:")
+            lines.append("\n📉 약세 예상:")
             for sector_info in bearish:
                 if isinstance(sector_info, dict):
-                    print(f"   • {sector_info.get('sector')}: {sector_info.get('reason')}")
+                    lines.append(f"   • {sector_info.get('sector')}: {sector_info.get('reason')}")
                 else:
-                    print(f"   • {sector_info}")
-        print()
+                    lines.append(f"   • {sector_info}")
+        lines.append("")
+        sys.stdout.write('\n'.join(lines) + '\n')
 
         # 6. 투자 전략
         print("[6] 투자 전략")
-        print("-" * 80)
+        print(SUB)
         print(report.get('investment_strategy', 'N/A'))
         print()
 
         # 7. 시간대별 전략
         daily_schedule = report.get('daily_schedule', {})
         if daily_schedule:
-            print("[7] 시간대별 전략")
-            print("-" * 80)
+            lines = ["[7] 시간대별 전략", SUB]
             for time_slot, strategy in daily_schedule.items():
                 time_formatted = time_slot.replace('_', ':')
-                print(f"⏰ {time_formatted}: {strategy}")
-            print()
+                lines.append(f"⏰ {time_formatted}: {strategy}")
+            lines.append("")
+            sys.stdout.write('\n'.join(lines) + '\n')
 
         # 8. 메타데이터
         metadata = report.get('metadata', {})
         print("[8] 메타데이터")
-        print("-" * 80)
+        print(SUB)
         print(f"생성 시각: {metadata.get('generated_at', 'N/A')}")
         market_data = metadata.get('market_data', {})
         print(f"전일 KOSPI: {market_data.get('kospi_close', 'N/A')} ({market_data.get('kospi_change', 'N/A')}%)")
@@ -273,15 +306,14 @@ async def test_morning_report(test_date: datetime):
         data_dir.mkdir(parents=True, exist_ok=True)
         output_file = data_dir / f"morning_report_{test_date.strftime('%Y%m%d')}.json"
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+        await asyncio.to_thread(output_file.write_bytes, payload)
 
         print(f"✅ Morning Report 저장: {output_file}")
         print()
 
-        print("=" * 80)
+        print(SEP)
         print("테스트 완료!")
-        print("=" * 80)
+        print(SEP)
 
     except Exception as e:
         print(f"❌ 테스트 실패: {e}")
@@ -292,8 +324,12 @@ async def test_morning_report(test_date: datetime):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Morning Report 생성 테스트')
     parser.add_argument('--date', type=str, help='테스트 날짜 (YYYY-MM-DD)', default=None)
+    parser.add_argument('--no-cache', action='store_true', help='LLM 응답 캐시 사용 안 함')
     args = parser.parse_args()
 
+    if args.no_cache:
+        settings.MINT_LLM_CACHE = False
+
     if args.date:
         test_date = datetime.strptime(args.date, '%Y-%m-%d')
     else:
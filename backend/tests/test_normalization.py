@@ -134,6 +134,23 @@ class TestScoreCalculator:
         expected = 2.4 + 2.25
         assert abs(score - expected) < 0.01
 
+    def test_calculate_weighted_score_reused_weights(self):
+        """가중 점수 계산 - 동일 가중치 반복 호출"""
+        weights = {'momentum': 0.3, 'volume': 0.25, 'sentiment': 0.2}
+
+        first = ScoreCalculator.calculate_weighted_score(
+            scores={'momentum': 8.0, 'volume': 9.0, 'sentiment': 7.0},
+            weights=weights
+        )
+        second = ScoreCalculator.calculate_weighted_score(
+            scores={'momentum': 8.0, 'volume': 9.0},  # sentiment 없음
+            weights=weights
+        )
+
+        # 캐싱된 가중치를 재사용해도 점수별 결과는 독립적
+        assert abs(first - (2.4 + 2.25 + 1.4)) < 0.01
+        assert abs(second - (2.4 + 2.25)) < 0.01
+
     def test_rank_normalize(self, sample_values):
         """순위 정규화 테스트"""
         ranked = ScoreCalculator.rank_normalize(sample_values, ascending=True)
@@ -160,6 +177,13 @@ class TestScoreCalculator:
         # 최대값의 순위는 0 (내림차순)
         assert ranked.iloc[-1] == 0.0
 
+    def test_rank_normalize_ties(self):
+        """순위 정규화 - 동점은 가장 낮은 순위 공유 (method='min')"""
+        values = pd.Series([10, 20, 20, 30, 40])
+        ranked = ScoreCalculator.rank_normalize(values, ascending=True)
+
+        assert list(ranked) == [0.0, 0.25, 0.25, 0.75, 1.0]
+
     def test_percentile_rank(self, sample_values):
         """백분위 순위 테스트"""
         # 35는 30과 40 사이 (상위 40%)
@@ -176,6 +200,17 @@ class TestScoreCalculator:
         percentile_min = ScoreCalculator.percentile_rank(sample_values, 10)
         assert percentile_min == 20.0
 
+    def test_percentile_rank_presorted(self, sample_values):
+        """백분위 순위 - 미리 정렬한 분포 재사용"""
+        sorted_values = np.sort(sample_values.to_numpy(dtype=float))
+
+        for value in (5, 10, 35, 50, 60):
+            expected = ScoreCalculator.percentile_rank(sample_values, value)
+            actual = ScoreCalculator.percentile_rank(
+                sample_values, value, sorted_values=sorted_values
+            )
+            assert actual == expected
+
     def test_sigmoid_normalize(self):
         """Sigmoid 정규화 테스트"""
         values = pd.Series([-2, -1, 0, 1, 2])
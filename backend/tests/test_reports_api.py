@@ -1,7 +1,12 @@
 """
 reports.py API 엔드포인트 테스트
 
-pytest backend/tests/test_reports_api.py -v
+pytest backend/tests/test_reports_api.py -v                                      # LLM mock (빠름, 비용 없음)
+RUN_LLM_TESTS=1 pytest backend/tests/test_reports_api.py -v -m llm_integration   # 실제 Gemini 호출 (nightly)
+pytest backend/tests -n auto --dist=loadfile                                      # 파일 단위 병렬 실행 (pytest-xdist)
+
+- 기본: conftest.mock_llm_report로 Gemini/KRX 호출을 tests/fixtures/*.json 응답으로 대체
+- @pytest.mark.llm_integration: 실제 LLM 호출 (시간 소요, 비용 발생, RUN_LLM_TESTS 미설정 시 skip)
 """
 
 import sys
@@ -11,98 +16,141 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+import asyncio
 import pytest
-from fastapi.testclient import TestClient
 from datetime import datetime, timedelta
 
-from app.main import app
-
-client = TestClient(app)
+pytestmark = pytest.mark.usefixtures("mock_llm_report", "frozen_today", "seeded_reports")
+
+# 리포트가 존재하지 않는 날짜 (1년 후)
+_FUTURE_DATE = (datetime.now() + timedelta(days=365)).strftime("%Y-%m-%d")
+
+# 생성 테스트용 날짜 (seeded_reports가 삽입하지 않은 FROZEN_NOW 전일)
+_UNSEEDED_DATE = "2025-11-13"
+
+# LLM 통합 생성 테스트용 날짜 (mock 생성 테스트와 겹치지 않는 미삽입 날짜)
+_LIVE_UNSEEDED_DATE = "2025-11-12"
+
+
+def _get_saved_report(test_engine, report_type, date):
+    """DB에 저장된 ReportResult 조회"""
+    from sqlalchemy.orm import Session
+    from app.db.models import ReportResult
+
+    with Session(test_engine) as db:
+        return db.query(ReportResult).filter(
+            ReportResult.report_type == report_type,
+            ReportResult.date == date
+        ).first()
+
+
+def _assert_morning_report_response(response):
+    """POST /morning/generate 응답 구조 검증"""
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["success"] is True
+    assert "data" in data
+    assert "message" in data
+    # 중복 생성 방지로 두 가지 메시지 모두 허용
+    assert data["message"] in ["장 시작 리포트가 생성되었습니다", "이미 생성된 리포트입니다"]
+
+    # 리포트 구조 검증
+    report = data["data"]
+    assert report["report_type"] == "morning"
+    assert "date" in report
+    assert "generated_at" in report
+    assert "market_forecast" in report
+    assert "kospi_range" in report
+    assert "top_stocks" in report
+    assert len(report["top_stocks"]) == 10  # Top 10
+    assert "sector_analysis" in report
+    assert "investment_strategy" in report
+    assert "daily_schedule" in report
+    assert "metadata" in report
+
+    # top_stocks 구조 검증
+    if len(report["top_stocks"]) > 0:
+        stock = report["top_stocks"][0]
+        assert "ticker" in stock
+        assert "name" in stock
+        assert "current_price" in stock
+        assert "reason" in stock
+        assert "entry_strategy" in stock  # 진입 전략
+
+        # entry_strategy 상세 검증
+        strategy = stock["entry_strategy"]
+        assert "entry_price" in strategy
+        assert "target_price_1" in strategy
+        assert "target_price_2" in strategy
+        assert "stop_loss" in strategy
+        assert "risk_reward_ratio" in strategy
+        assert "holding_period" in strategy
 
 
 class TestReportsAPI:
     """reports.py API 엔드포인트 테스트"""
 
+    def test_generate_morning_report(self, client, test_engine):
+        """POST /morning/generate - 장 시작 리포트 생성 (LLM mock)"""
+        assert _get_saved_report(test_engine, "morning", _UNSEEDED_DATE) is None
+
+        response = client.post(f"/api/v1/reports/morning/generate?date={_UNSEEDED_DATE}")
+
+        _assert_morning_report_response(response)
+        assert response.json()["message"] == "장 시작 리포트가 생성되었습니다"
+        assert response.json()["data"]["date"] == _UNSEEDED_DATE
+
+        # DB 저장 확인
+        saved = _get_saved_report(test_engine, "morning", _UNSEEDED_DATE)
+        assert saved is not None
+        assert saved.model_name == "gemini-2.5-flash"
+
     @pytest.mark.llm_integration
-    def test_generate_morning_report(self):
+    def test_generate_morning_report_live(self, client, test_engine):
         """
         POST /morning/generate - 장 시작 리포트 생성 (LLM 통합 테스트)
 
         주의: 실제 Gemini API 호출 (Google Search Grounding 포함)
-        - 실행 시간: 2-5분 (첫 호출), 두 번째 호출은 skip되어 즉시 반환
-        - 비용: ~$0.05/request (첫 호출만)
+        - 실행 시간: 2-5분
+        - 비용: ~$0.05/request
         - API 키 필요: GEMINI_API_KEY
-        - 중복 생성 방지: 같은 날짜 리포트 있으면 skip
+        - seeded_reports가 삽입하지 않은 날짜로 생성 (중복 생성 방지 skip 경로 회피)
         """
-        # 첫 번째 호출: 실제 생성 (LLM 호출)
-        response = client.post("/api/v1/reports/morning/generate")
+        assert _get_saved_report(test_engine, "morning", _LIVE_UNSEEDED_DATE) is None
 
-        assert response.status_code == 200
-        data = response.json()
+        response = client.post(f"/api/v1/reports/morning/generate?date={_LIVE_UNSEEDED_DATE}")
 
-        assert data["success"] is True
-        assert "data" in data
-        assert "message" in data
-        # 중복 생성 방지로 두 가지 메시지 모두 허용
-        assert data["message"] in ["장 시작 리포트가 생성되었습니다", "이미 생성된 리포트입니다"]
+        _assert_morning_report_response(response)
+        assert response.json()["message"] == "장 시작 리포트가 생성되었습니다"
+        assert _get_saved_report(test_engine, "morning", _LIVE_UNSEEDED_DATE) is not None
 
-        # 리포트 구조 검증
-        report = data["data"]
-        assert report["report_type"] == "morning"
-        assert "date" in report
-        assert "generated_at" in report
-        assert "market_forecast" in report
-        assert "kospi_range" in report
-        assert "top_stocks" in report
-        assert len(report["top_stocks"]) == 10  # Top 10
-        assert "sector_analysis" in report
-        assert "investment_strategy" in report
-        assert "daily_schedule" in report
-        assert "metadata" in report
-
-        # top_stocks 구조 검증
-        if len(report["top_stocks"]) > 0:
-            stock = report["top_stocks"][0]
-            assert "ticker" in stock
-            assert "name" in stock
-            assert "current_price" in stock
-            assert "reason" in stock
-            assert "entry_strategy" in stock  # 진입 전략
-
-            # entry_strategy 상세 검증
-            strategy = stock["entry_strategy"]
-            assert "entry_price" in strategy
-            assert "target_price_1" in strategy
-            assert "target_price_2" in strategy
-            assert "stop_loss" in strategy
-            assert "risk_reward_ratio" in strategy
-            assert "holding_period" in strategy
-
-    def test_get_morning_report(self):
-        """GET /morning - 장 시작 리포트 조회 (LLM 필요)"""
-        client.post("/api/v1/reports/morning/generate")
-
-        # 리포트 조회
-        today = datetime.now().strftime("%Y-%m-%d")
-        response = client.get(f"/api/v1/reports/morning?date={today}")
+    def test_get_morning_report(self, client, frozen_today):
+        """GET /morning - 장 시작 리포트 조회"""
+        # 리포트 조회 (seeded_reports로 오늘 리포트 삽입됨)
+        response = client.get(f"/api/v1/reports/morning?date={frozen_today}")
 
         assert response.status_code == 200
         data = response.json()
 
         assert data["success"] is True
         assert data["data"]["report_type"] == "morning"
-        assert data["data"]["date"] == today
+        assert data["data"]["date"] == frozen_today
 
-    def test_generate_afternoon_report(self):
+    def test_generate_afternoon_report(self, client, test_engine):
         """POST /afternoon/generate - 장 마감 리포트 생성"""
-        response = client.post("/api/v1/reports/afternoon/generate")
+        assert _get_saved_report(test_engine, "afternoon", _UNSEEDED_DATE) is None
+
+        response = client.post(f"/api/v1/reports/afternoon/generate?date={_UNSEEDED_DATE}")
 
         assert response.status_code == 200
         data = response.json()
 
         assert data["success"] is True
-        # 중복 생성 방지로 두 가지 메시지 모두 허용
-        assert data["message"] in ["장 마감 리포트가 생성되었습니다", "이미 생성된 리포트입니다"]
+        assert data["message"] == "장 마감 리포트가 생성되었습니다"
+
+        # DB 저장 확인
+        assert _get_saved_report(test_engine, "afternoon", _UNSEEDED_DATE) is not None
 
         # 리포트 구조 검증
         report = data["data"]
@@ -117,58 +165,61 @@ class TestReportsAPI:
         assert "kospi_close" in summary
         assert "kospi_change" in summary
         assert "trading_value" in summary
-        assert "foreign_net" in summary
-        assert "institution_net" in summary
+        assert "foreign_net_kospi" in summary
+        assert "institution_net_kospi" in summary
 
-    def test_get_afternoon_report(self):
+    def test_get_afternoon_report(self, client, frozen_today):
         """GET /afternoon - 장 마감 리포트 조회"""
-        # 먼저 리포트 생성
-        client.post("/api/v1/reports/afternoon/generate")
-
-        # 리포트 조회
-        today = datetime.now().strftime("%Y-%m-%d")
-        response = client.get(f"/api/v1/reports/afternoon?date={today}")
+        # 리포트 조회 (seeded_reports로 오늘 리포트 삽입됨)
+        response = client.get(f"/api/v1/reports/afternoon?date={frozen_today}")
 
         assert response.status_code == 200
         data = response.json()
 
         assert data["success"] is True
         assert data["data"]["report_type"] == "afternoon"
-        assert data["data"]["date"] == today
-
-    def test_get_latest_report_afternoon(self):
-        """GET /latest - 최신 리포트 조회 (오후 리포트만 사용)"""
-        # 더미 데이터 생성 (LLM 호출 없음)
-        now = datetime.now()
-        current_time = now.time()
-
-        # 시간대별로 필요한 리포트 생성 (오후 리포트만 사용)
-        if current_time < datetime.strptime("08:30", "%H:%M").time():
-            # 08:30 이전: 전일 오후 리포트 필요
-            yesterday = (now - timedelta(days=1)).strftime("%Y-%m-%d")
-            client.post(f"/api/v1/reports/afternoon/generate?date={yesterday}")
-        elif current_time < datetime.strptime("15:40", "%H:%M").time():
-            # 08:30-15:40: 당일 오전 리포트 필요 → 오후 리포트로 대체 (테스트용)
-            # 실제로는 오전 리포트가 필요하지만, LLM 호출 피하기 위해 오후 사용
-            client.post("/api/v1/reports/afternoon/generate")
-        else:
-            # 15:40 이후: 당일 오후 리포트 필요
-            client.post("/api/v1/reports/afternoon/generate")
-
-        response = client.get("/api/v1/reports/latest")
-
-        # 시간대에 따라 404일 수 있음 (오전 시간대에 오후 리포트 생성 시)
-        if response.status_code == 200:
-            data = response.json()
-            assert data["success"] is True
-            assert "data" in data
-            assert data["data"]["report_type"] in ["morning", "afternoon"]
-
-    def test_get_report_history(self):
-        """GET /history - 리포트 히스토리 조회"""
-        # 더미 데이터만 생성 (LLM 호출 없음)
-        client.post("/api/v1/reports/afternoon/generate")
+        assert data["data"]["date"] == frozen_today
 
+    @pytest.mark.parametrize("report_type", ["morning", "afternoon"])
+    def test_get_report_fast_serialize_matches(self, client, frozen_today, report_type):
+        """
+        GET /morning, /afternoon - MINT_FAST_SERIALIZE(response_model=None) 응답이
+        ReportResponse 검증 경로 응답과 동일한지 확인
+        """
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from app.api.v1 import reports
+
+        # MINT_FAST_SERIALIZE=1일 때와 같은 라우트 등록 (재검증 생략)
+        endpoint = {
+            "morning": reports.get_morning_report,
+            "afternoon": reports.get_afternoon_report,
+        }[report_type]
+        fast_app = FastAPI()
+        fast_app.add_api_route(
+            f"/api/v1/reports/{report_type}", endpoint, methods=["GET"], response_model=None
+        )
+
+        url = f"/api/v1/reports/{report_type}?date={frozen_today}"
+        validated = client.get(url)
+        fast = TestClient(fast_app).get(url)
+
+        assert validated.status_code == fast.status_code == 200
+        assert fast.json() == validated.json()
+
+    @pytest.mark.asyncio
+    async def test_get_latest_report_afternoon(self, async_client, frozen_today):
+        """GET /latest - 최신 리포트 조회 (16:00 고정 → 당일 장 마감 리포트)"""
+        response = await async_client.get("/api/v1/reports/latest")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["data"]["report_type"] == "afternoon"
+        assert data["data"]["date"] == frozen_today
+
+    def test_get_report_history(self, client):
+        """GET /history - 리포트 히스토리 조회"""
         # 히스토리 조회
         response = client.get("/api/v1/reports/history?limit=10")
 
@@ -188,11 +239,8 @@ class TestReportsAPI:
             assert "generated_at" in report
             assert "id" in report
 
-    def test_get_report_history_with_type_filter(self):
+    def test_get_report_history_with_type_filter(self, client):
         """GET /history - 타입별 필터링"""
-        # 오후 리포트만 생성 (LLM 호출 없음)
-        client.post("/api/v1/reports/afternoon/generate")
-
         # afternoon으로 조회
         response = client.get("/api/v1/reports/history?report_type=afternoon&limit=5")
 
@@ -204,13 +252,18 @@ class TestReportsAPI:
         for report in data["data"]["reports"]:
             assert report["report_type"] == "afternoon"
 
-    def test_get_report_stats(self):
-        """GET /stats - 리포트 통계 조회"""
-        # 먼저 리포트 생성
-        client.post("/api/v1/reports/morning/generate")
-        client.post("/api/v1/reports/afternoon/generate")
+    @pytest.mark.asyncio
+    async def test_get_report_stats(self, async_client, frozen_today):
+        """GET /stats - 리포트 통계 조회 (당일 장 시작 / 장 마감 리포트 조회와 동시 요청)"""
+        response, morning_response, afternoon_response = await asyncio.gather(
+            async_client.get("/api/v1/reports/stats"),
+            async_client.get(f"/api/v1/reports/morning?date={frozen_today}"),
+            async_client.get(f"/api/v1/reports/afternoon?date={frozen_today}"),
+        )
 
-        response = client.get("/api/v1/reports/stats")
+        # 통계에 집계된 리포트가 실제로 조회되는지 확인
+        assert morning_response.status_code == 200
+        assert afternoon_response.status_code == 200
 
         assert response.status_code == 200
         data = response.json()
@@ -224,40 +277,23 @@ class TestReportsAPI:
 
         # 최소 2개 리포트 (morning + afternoon)
         assert data["data"]["total_reports"] >= 2
-
-    def test_get_morning_report_not_found(self):
-        """GET /morning - 존재하지 않는 날짜 리포트 조회"""
-        # 존재하지 않는 날짜
-        future_date = (datetime.now() + timedelta(days=365)).strftime("%Y-%m-%d")
-        response = client.get(f"/api/v1/reports/morning?date={future_date}")
-
-        assert response.status_code == 404
-        assert "리포트가 없습니다" in response.json()["detail"]
-
-    def test_get_afternoon_report_not_found(self):
-        """GET /afternoon - 존재하지 않는 날짜 리포트 조회"""
-        # 존재하지 않는 날짜
-        future_date = (datetime.now() + timedelta(days=365)).strftime("%Y-%m-%d")
-        response = client.get(f"/api/v1/reports/afternoon?date={future_date}")
-
-        assert response.status_code == 404
-        assert "리포트가 없습니다" in response.json()["detail"]
-
-    def test_invalid_date_format_morning(self):
-        """잘못된 날짜 형식 테스트 (morning)"""
-        response = client.get("/api/v1/reports/morning?date=invalid-date")
-
-        assert response.status_code == 400
-        assert "잘못된 날짜 형식" in response.json()["detail"]
-
-    def test_invalid_date_format_afternoon(self):
-        """잘못된 날짜 형식 테스트 (afternoon)"""
-        response = client.get("/api/v1/reports/afternoon?date=invalid-date")
-
-        assert response.status_code == 400
-        assert "잘못된 날짜 형식" in response.json()["detail"]
-
-    def test_generate_report_with_specific_date(self):
+        assert data["data"]["by_type"]["morning"] >= 1
+        assert data["data"]["by_type"]["afternoon"] >= 1
+
+    @pytest.mark.parametrize("report_type,date,status_code,detail", [
+        ("morning", _FUTURE_DATE, 404, "리포트가 없습니다"),
+        ("afternoon", _FUTURE_DATE, 404, "리포트가 없습니다"),
+        ("morning", "invalid-date", 400, "잘못된 날짜 형식"),
+        ("afternoon", "invalid-date", 400, "잘못된 날짜 형식"),
+    ])
+    def test_get_report_errors(self, client, report_type, date, status_code, detail):
+        """GET /morning, /afternoon - 존재하지 않는 날짜 / 잘못된 날짜 형식"""
+        response = client.get(f"/api/v1/reports/{report_type}?date={date}")
+
+        assert response.status_code == status_code
+        assert detail in response.json()["detail"]
+
+    def test_generate_report_with_specific_date(self, client):
         """특정 날짜로 리포트 생성"""
         specific_date = "2025-11-01"
 
@@ -14,6 +14,7 @@ from app.scheduler import start_scheduler, stop_scheduler
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 import asyncio
 import logging
+import signal
 
 # 로깅 설정
 logging.basicConfig(
@@ -53,11 +54,20 @@ async def main():
     print("   (Ctrl+C로 종료)")
     print("=" * 80)
 
+    # 종료 시그널까지 대기 (폴링 없이 이벤트로 대기)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            # Windows: add_signal_handler 미지원 → Ctrl+C는 KeyboardInterrupt로 처리
+            pass
+
     try:
-        # 스케줄러 계속 실행 (무한 대기)
-        while True:
-            await asyncio.sleep(1)
-    except KeyboardInterrupt:
+        await stop.wait()
+        logger.info("\n사용자 중단")
+    except (KeyboardInterrupt, asyncio.CancelledError):
         logger.info("\n사용자 중단")
     finally:
         stop_scheduler()
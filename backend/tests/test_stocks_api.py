@@ -2,6 +2,7 @@
 stocks.py API 엔드포인트 테스트
 
 pytest backend/tests/test_stocks_api.py -v
+pytest backend/tests -n auto --dist=loadfile  # 파일 단위 병렬 실행 (pytest-xdist)
 """
 
 import sys
@@ -12,21 +13,18 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 import pytest
-from fastapi.testclient import TestClient
 from datetime import datetime, timedelta
 
-from app.main import app
-
-client = TestClient(app)
+pytestmark = [pytest.mark.asyncio, pytest.mark.usefixtures("seeded_stocks")]
 
 
 class TestStocksAPI:
     """stocks.py API 엔드포인트 테스트"""
 
-    def test_get_stock_info(self):
+    async def test_get_stock_info(self, async_client):
         """GET /{ticker} - 종목 기본 정보 조회"""
         # 삼성전자 조회
-        response = client.get("/api/v1/stocks/005930")
+        response = await async_client.get("/api/v1/stocks/005930")
 
         assert response.status_code == 200
         data = response.json()
@@ -39,15 +37,15 @@ class TestStocksAPI:
         # market_cap은 0일 수도 있음 (거래일이 아닐 때)
         assert data["data"]["market_cap"] >= 0
 
-    def test_get_stock_info_not_found(self):
+    async def test_get_stock_info_not_found(self, async_client):
         """GET /{ticker} - 존재하지 않는 종목"""
-        response = client.get("/api/v1/stocks/999999")
+        response = await async_client.get("/api/v1/stocks/999999")
 
         assert response.status_code == 404
 
-    def test_get_price_history_with_period(self):
+    async def test_get_price_history_with_period(self, async_client):
         """GET /{ticker}/price - 가격 히스토리 (period 파라미터)"""
-        response = client.get("/api/v1/stocks/005930/price?period=30")
+        response = await async_client.get("/api/v1/stocks/005930/price?period=30")
 
         assert response.status_code == 200
         data = response.json()
@@ -68,12 +66,12 @@ class TestStocksAPI:
         assert "volume" in price
         assert "trading_value" in price
 
-    def test_get_price_history_with_dates(self):
+    async def test_get_price_history_with_dates(self, async_client):
         """GET /{ticker}/price - 가격 히스토리 (start_date, end_date)"""
         end_date = datetime.now().strftime("%Y-%m-%d")
         start_date = (datetime.now() - timedelta(days=10)).strftime("%Y-%m-%d")
 
-        response = client.get(
+        response = await async_client.get(
             f"/api/v1/stocks/005930/price?start_date={start_date}&end_date={end_date}"
         )
 
@@ -84,9 +82,9 @@ class TestStocksAPI:
         assert data["data"]["period"]["start"] == start_date
         assert data["data"]["period"]["end"] == end_date
 
-    def test_get_current_price(self):
+    async def test_get_current_price(self, async_client):
         """GET /{ticker}/current - 현재가 조회"""
-        response = client.get("/api/v1/stocks/005930/current")
+        response = await async_client.get("/api/v1/stocks/005930/current")
 
         assert response.status_code == 200
         data = response.json()
@@ -100,9 +98,9 @@ class TestStocksAPI:
         assert "trading_value" in data["data"]
         assert "timestamp" in data["data"]
 
-    def test_search_stocks_with_keyword(self):
+    async def test_search_stocks_with_keyword(self, async_client):
         """GET / - 종목 검색 (키워드)"""
-        response = client.get("/api/v1/stocks?keyword=삼성&limit=5")
+        response = await async_client.get("/api/v1/stocks", params={"keyword": "삼성", "limit": 5})
 
         assert response.status_code == 200
         data = response.json()
@@ -110,38 +108,39 @@ class TestStocksAPI:
         assert data["success"] is True
         assert "total" in data["data"]
         assert "stocks" in data["data"]
-        assert len(data["data"]["stocks"]) <= 5
+        assert 0 < len(data["data"]["stocks"]) <= 5
 
         # 모든 종목명에 "삼성" 포함 확인
         for stock in data["data"]["stocks"]:
             assert "삼성" in stock["name"] or "005930" in stock["ticker"]
 
-    def test_search_stocks_with_market(self):
+    async def test_search_stocks_with_market(self, async_client):
         """GET / - 종목 검색 (시장 필터)"""
-        response = client.get("/api/v1/stocks?market=KOSPI&limit=10")
+        response = await async_client.get("/api/v1/stocks", params={"market": "KOSPI", "limit": 10})
 
         assert response.status_code == 200
         data = response.json()
 
         assert data["success"] is True
+        assert len(data["data"]["stocks"]) > 0
 
         # 모든 종목이 KOSPI인지 확인
         for stock in data["data"]["stocks"]:
             assert stock["market"] == "KOSPI"
 
-    def test_search_stocks_no_filter(self):
+    async def test_search_stocks_no_filter(self, async_client):
         """GET / - 종목 검색 (필터 없음)"""
-        response = client.get("/api/v1/stocks?limit=20")
+        response = await async_client.get("/api/v1/stocks", params={"limit": 20})
 
         assert response.status_code == 200
         data = response.json()
 
         assert data["success"] is True
-        assert len(data["data"]["stocks"]) <= 20
+        assert 0 < len(data["data"]["stocks"]) <= 20
 
-    def test_get_technical_indicators(self):
+    async def test_get_technical_indicators(self, async_client):
         """GET /{ticker}/technical - 기술적 지표 조회"""
-        response = client.get("/api/v1/stocks/005930/technical")
+        response = await async_client.get("/api/v1/stocks/005930/technical")
 
         assert response.status_code == 200
         data = response.json()
@@ -161,11 +160,11 @@ class TestStocksAPI:
         # RSI는 0-100 범위
         assert 0 <= data["data"]["rsi"] <= 100
 
-    def test_get_technical_indicators_with_date(self):
+    async def test_get_technical_indicators_with_date(self, async_client):
         """GET /{ticker}/technical - 기술적 지표 (특정 날짜)"""
         target_date = (datetime.now() - timedelta(days=5)).strftime("%Y-%m-%d")
 
-        response = client.get(f"/api/v1/stocks/005930/technical?date={target_date}")
+        response = await async_client.get(f"/api/v1/stocks/005930/technical?date={target_date}")
 
         assert response.status_code == 200
         data = response.json()
@@ -9,6 +9,7 @@ Top 50 선정 테스트 (Momentum, Volume, Technical)
 """
 
 import asyncio
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -19,7 +20,7 @@ sys.path.insert(0, str(project_root))
 
 from app.services.llm_report import LLMReport
 from app.db.database import init_db
-import pandas as pd
+from _phase1_cache import load_phase1_scores
 
 
 async def test_top50_selection():
@@ -29,9 +30,6 @@ async def test_top50_selection():
     print("=" * 80)
     print()
 
-    # DB 초기화
-    init_db()
-
     # LLMReport 서비스 생성
     report_service = LLMReport()
 
@@ -47,38 +45,8 @@ async def test_top50_selection():
     print()
 
     try:
-        # select_top_stocks_for_morning 호출하되, 센티먼트 분석 전까지만 테스트
-        # 임시로 _calculate_all_scores까지만 호출
-        from app.db.database import get_db
-        from app.db.models import FinancialData
-
-        # 1.1: 시장 스냅샷 + DB 데이터 조회
-        print("[Step 1.1] 시장 스냅샷 + DB 데이터 조회")
-        df_market = await report_service.data_service.get_market_snapshot(test_date)
-        print(f"  - 시장 스냅샷: {len(df_market)}개 종목")
-
-        with get_db() as db:
-            all_stocks = db.query(FinancialData).all()
-            df_financial = pd.DataFrame([stock.to_dict() for stock in all_stocks])
-        print(f"  - DB 조회: {len(df_financial)}개 종목")
-
-        df = df_market.merge(df_financial, on='ticker', how='inner')
-        print(f"  - Merge: {len(df)}개 종목")
-
-        # 유효성 검증
-        df = df[
-            (df['per'] > 0) &
-            (df['pbr'] > 0) &
-            (df['market_cap'] > 0) &
-            (df['종가'] > 0)
-        ].copy()
-        print(f"  - 유효성 검증 후: {len(df)}개 종목")
-        print()
-
-        # 1.2-1.4: 3개 점수 계산
-        print("[Step 1.2-1.4] 3개 점수 계산 (Momentum, Volume, Technical)")
-        df = await report_service._calculate_all_scores(df, test_date)
-        print()
+        # 1.1-1.4: 시장 스냅샷 + DB 조회 + 3개 점수 계산 (날짜별 캐시 공유)
+        df = await load_phase1_scores(report_service, test_date)
 
         # 점수 통계
         print("=" * 80)
@@ -142,13 +110,14 @@ async def test_top50_selection():
                       f"종가 {row['종가']:>8,.0f}원 | {row.get('name', 'N/A')}")
             print()
 
-        # CSV 저장
-        data_dir = Path(__file__).parent.parent.parent / "data"
-        data_dir.mkdir(parents=True, exist_ok=True)
-        output_file = data_dir / "top50_test_result.csv"
-        top_50.to_csv(output_file, index=False, encoding='utf-8-sig')
-        print(f"✅ Top 50 결과 저장: {output_file}")
-        print()
+        # CSV 저장 (MINT_SAVE_TEST_ARTIFACTS=1일 때만)
+        if os.getenv("MINT_SAVE_TEST_ARTIFACTS"):
+            data_dir = Path(__file__).parent.parent.parent / "data"
+            data_dir.mkdir(parents=True, exist_ok=True)
+            output_file = data_dir / "top50_test_result.csv"
+            top_50.to_csv(output_file, index=False, encoding='utf-8-sig')
+            print(f"✅ Top 50 결과 저장: {output_file}")
+            print()
 
         print("=" * 80)
         print("테스트 완료!")
@@ -161,4 +130,6 @@ async def test_top50_selection():
 
 
 if __name__ == "__main__":
+    # DB 초기화
+    init_db()
     asyncio.run(test_top50_selection())
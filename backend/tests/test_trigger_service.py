@@ -1,23 +1,151 @@
 """
 TriggerService 테스트 스크립트
+
+python backend/tests/test_trigger_service.py          # 8개 함수 결과 출력 (스크립트)
+pytest backend/tests/test_trigger_service.py          # 개별 / 통합 실행 검증 (모듈 단위 이벤트 루프 / 서비스 공유)
+pytest backend/tests/test_trigger_service.py -n 6     # 트리거별 병렬 실행 (pytest-xdist)
 """
 
 import asyncio
 import sys
+import time
+import traceback
 from datetime import datetime
 from pathlib import Path
 
 # backend 디렉토리를 Python 경로에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import pytest
+
 from app.services.trigger_service import TriggerService
 from app.services.data_service import DataService
 
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+@pytest.fixture(scope="module")
+def trigger_service():
+    """모듈 내 테스트가 공유하는 TriggerService (DataService 1회 생성)"""
+    return TriggerService(DataService())
+
+
+def _unwrap(result):
+    """asyncio.gather(return_exceptions=True) 결과에서 예외면 다시 발생"""
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+def _assert_morning_results(results):
+    """run_morning_triggers 결과 검증"""
+    assert isinstance(results, dict), "결과는 dict 타입이어야 함"
+    assert 'volume_surge' in results, "volume_surge 키 필요"
+    assert 'gap_up' in results, "gap_up 키 필요"
+    assert 'fund_inflow' in results, "fund_inflow 키 필요"
+
+    # Trigger 모델 검증
+    if results['volume_surge']:
+        first_trigger = results['volume_surge'][0]
+        assert hasattr(first_trigger, 'ticker'), "Trigger 모델에 ticker 필드 필요"
+        assert hasattr(first_trigger, 'name'), "Trigger 모델에 name 필드 필요"
+        assert hasattr(first_trigger, 'trigger_type'), "Trigger 모델에 trigger_type 필드 필요"
+        assert first_trigger.trigger_type == 'volume_surge', "trigger_type이 올바르지 않음"
+        assert first_trigger.session == 'morning', "session이 morning이어야 함"
+
+
+def _assert_afternoon_results(results):
+    """run_afternoon_triggers 결과 검증"""
+    assert isinstance(results, dict), "결과는 dict 타입이어야 함"
+    assert 'intraday_rise' in results, "intraday_rise 키 필요"
+    assert 'closing_strength' in results, "closing_strength 키 필요"
+    assert 'sideways_volume' in results, "sideways_volume 키 필요"
+
+    # Trigger 모델 검증
+    if results['intraday_rise']:
+        first_trigger = results['intraday_rise'][0]
+        assert first_trigger.trigger_type == 'intraday_rise', "trigger_type이 올바르지 않음"
+        assert first_trigger.session == 'afternoon', "session이 afternoon이어야 함"
+
+
+# 개별 트리거 (메서드명, 결과에 포함되어야 하는 필드)
+PROBES = [
+    ("morning_volume_surge", ("volume_increase_rate", "composite_score")),
+    ("morning_gap_up", ("gap_ratio", "intraday_change")),
+    ("morning_fund_inflow", ("fund_inflow_ratio",)),
+    ("afternoon_intraday_rise", ("intraday_change",)),
+    ("afternoon_closing_strength", ("closing_strength", "volume_increase_rate")),
+    ("afternoon_sideways_volume", ("intraday_change", "volume_increase_rate")),
+]
+
 
-async def test_trigger_service():
-    data_service = DataService()
-    trigger_service = TriggerService(data_service)
+@pytest.mark.parametrize("method,fields", PROBES, ids=[method for method, _ in PROBES])
+async def test_trigger_probe(trigger_service, method, fields):
+    """개별 트리거 Top 3 감지 결과 구조 검증"""
+    results = await getattr(trigger_service, method)(datetime.now(), top_n=3)
 
+    assert isinstance(results, list)
+    assert len(results) <= 3
+    for stock in results:
+        assert 'ticker' in stock
+        assert 'name' in stock
+        for field in fields:
+            assert field in stock, f"{method}: {field} 필드 필요"
+
+
+async def test_run_morning_triggers(trigger_service):
+    """오전 트리거 통합 실행 (run_morning_triggers)"""
+    results = await trigger_service.run_morning_triggers(datetime.now())
+    _assert_morning_results(results)
+
+
+async def test_run_afternoon_triggers(trigger_service):
+    """오후 트리거 통합 실행 (run_afternoon_triggers)"""
+    results = await trigger_service.run_afternoon_triggers(datetime.now())
+    _assert_afternoon_results(results)
+
+
+# run_*_triggers 병렬 실행 검증용 (개별 트리거 1회 소요 시간)
+_PROBE_DELAY = 0.2
+
+_FAKE_TRIGGER_ITEM = {
+    'ticker': '005930',
+    'name': '삼성전자',
+    'current_price': 70000,
+    'change_rate': 3.5,
+    'volume': 1_000_000,
+    'trading_value': 70_000_000_000,
+    'composite_score': 0.8,
+}
+
+
+async def _slow_probe(date, top_n=3):
+    """_PROBE_DELAY만큼 걸리는 가짜 트리거"""
+    await asyncio.sleep(_PROBE_DELAY)
+    return [dict(_FAKE_TRIGGER_ITEM)]
+
+
+@pytest.mark.parametrize("session,probes", [
+    ("morning", ("morning_volume_surge", "morning_gap_up", "morning_fund_inflow")),
+    ("afternoon", ("afternoon_intraday_rise", "afternoon_closing_strength", "afternoon_sideways_volume")),
+])
+async def test_run_triggers_runs_probes_concurrently(monkeypatch, session, probes):
+    """run_*_triggers가 3개 트리거를 동시에 실행 (순차 실행이면 3 x _PROBE_DELAY 소요)"""
+    service = TriggerService(DataService())
+    for probe in probes:
+        monkeypatch.setattr(service, probe, _slow_probe)
+    monkeypatch.setattr(service, "_save_triggers_to_db", lambda *args, **kwargs: None)
+
+    start = time.perf_counter()
+    results = await getattr(service, f"run_{session}_triggers")(datetime.now())
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 2 * _PROBE_DELAY, f"{session} 트리거가 순차 실행됨 ({elapsed:.2f}초)"
+    assert all(len(triggers) == 1 for triggers in results.values())
+
+
+async def run_report(trigger_service: TriggerService):
+    """8개 함수 실행 결과 출력 (스크립트 실행용)"""
     print("=== TriggerService 테스트 시작 ===\n")
 
     # 테스트 날짜 (최근 거래일)
@@ -25,9 +153,23 @@ async def test_trigger_service():
 
     # ============= 개별 트리거 테스트 =============
 
+    # 6개 트리거는 서로 독립적이므로 동시에 실행 후 순서대로 출력
+    (
+        volume_surge, gap_up, fund_inflow,
+        intraday_rise, closing_strength, sideways_volume
+    ) = await asyncio.gather(
+        trigger_service.morning_volume_surge(test_date, top_n=3),
+        trigger_service.morning_gap_up(test_date, top_n=3),
+        trigger_service.morning_fund_inflow(test_date, top_n=3),
+        trigger_service.afternoon_intraday_rise(test_date, top_n=3),
+        trigger_service.afternoon_closing_strength(test_date, top_n=3),
+        trigger_service.afternoon_sideways_volume(test_date, top_n=3),
+        return_exceptions=True
+    )
+
     print("1. 오전 트리거 1: 거래량 급증...")
     try:
-        results = await trigger_service.morning_volume_surge(test_date, top_n=3)
+        results = _unwrap(volume_surge)
         print(f"✅ 감지 완료: {len(results)}개 종목")
         if results:
             print(f"\n상위 종목:")
@@ -38,14 +180,13 @@ async def test_trigger_service():
                 print(f"      복합점수: {stock['composite_score']:.3f}")
     except Exception as e:
         print(f"❌ 실패: {e}")
-        import traceback
         traceback.print_exc()
 
     print("\n" + "="*70 + "\n")
 
     print("2. 오전 트리거 2: 갭 상승 모멘텀...")
     try:
-        results = await trigger_service.morning_gap_up(test_date, top_n=3)
+        results = _unwrap(gap_up)
         print(f"✅ 감지 완료: {len(results)}개 종목")
         if results:
             print(f"\n상위 종목:")
@@ -61,7 +202,7 @@ async def test_trigger_service():
 
     print("3. 오전 트리거 3: 시총 대비 자금유입...")
     try:
-        results = await trigger_service.morning_fund_inflow(test_date, top_n=3)
+        results = _unwrap(fund_inflow)
         print(f"✅ 감지 완료: {len(results)}개 종목")
         if results:
             print(f"\n상위 종목:")
@@ -75,7 +216,7 @@ async def test_trigger_service():
 
     print("4. 오후 트리거 1: 일중 상승률...")
     try:
-        results = await trigger_service.afternoon_intraday_rise(test_date, top_n=3)
+        results = _unwrap(intraday_rise)
         print(f"✅ 감지 완료: {len(results)}개 종목")
         if results:
             print(f"\n상위 종목:")
@@ -89,7 +230,7 @@ async def test_trigger_service():
 
     print("5. 오후 트리거 2: 마감 강도...")
     try:
-        results = await trigger_service.afternoon_closing_strength(test_date, top_n=3)
+        results = _unwrap(closing_strength)
         print(f"✅ 감지 완료: {len(results)}개 종목")
         if results:
             print(f"\n상위 종목:")
@@ -104,7 +245,7 @@ async def test_trigger_service():
 
     print("6. 오후 트리거 3: 횡보주 거래량...")
     try:
-        results = await trigger_service.afternoon_sideways_volume(test_date, top_n=3)
+        results = _unwrap(sideways_volume)
         print(f"✅ 감지 완료: {len(results)}개 종목")
         if results:
             print(f"\n상위 종목:")
@@ -121,9 +262,16 @@ async def test_trigger_service():
 
     # ============= 통합 실행 테스트 =============
 
+    # 오전 / 오후 통합 실행도 서로 독립적이므로 동시에 실행
+    morning_results, afternoon_results = await asyncio.gather(
+        trigger_service.run_morning_triggers(test_date),
+        trigger_service.run_afternoon_triggers(test_date),
+        return_exceptions=True
+    )
+
     print("7. 오전 트리거 통합 실행 (run_morning_triggers)...")
     try:
-        results = await trigger_service.run_morning_triggers(test_date)
+        results = _unwrap(morning_results)
 
         print(f"✅ 통합 실행 완료")
         print(f"\n트리거별 종목 수:")
@@ -135,31 +283,19 @@ async def test_trigger_service():
         print(f"\n총 {total}개 종목 감지")
 
         # 검증
-        assert isinstance(results, dict), "결과는 dict 타입이어야 함"
-        assert 'volume_surge' in results, "volume_surge 키 필요"
-        assert 'gap_up' in results, "gap_up 키 필요"
-        assert 'fund_inflow' in results, "fund_inflow 키 필요"
-
-        # Trigger 모델 검증
+        _assert_morning_results(results)
         if results['volume_surge']:
-            first_trigger = results['volume_surge'][0]
-            assert hasattr(first_trigger, 'ticker'), "Trigger 모델에 ticker 필드 필요"
-            assert hasattr(first_trigger, 'name'), "Trigger 모델에 name 필드 필요"
-            assert hasattr(first_trigger, 'trigger_type'), "Trigger 모델에 trigger_type 필드 필요"
-            assert first_trigger.trigger_type == 'volume_surge', "trigger_type이 올바르지 않음"
-            assert first_trigger.session == 'morning', "session이 morning이어야 함"
             print("\n  ✓ Trigger 모델 검증 통과")
 
     except Exception as e:
         print(f"❌ 실패: {e}")
-        import traceback
         traceback.print_exc()
 
     print("\n" + "="*70 + "\n")
 
     print("8. 오후 트리거 통합 실행 (run_afternoon_triggers)...")
     try:
-        results = await trigger_service.run_afternoon_triggers(test_date)
+        results = _unwrap(afternoon_results)
 
         print(f"✅ 통합 실행 완료")
         print(f"\n트리거별 종목 수:")
@@ -171,21 +307,12 @@ async def test_trigger_service():
         print(f"\n총 {total}개 종목 감지")
 
         # 검증
-        assert isinstance(results, dict), "결과는 dict 타입이어야 함"
-        assert 'intraday_rise' in results, "intraday_rise 키 필요"
-        assert 'closing_strength' in results, "closing_strength 키 필요"
-        assert 'sideways_volume' in results, "sideways_volume 키 필요"
-
-        # Trigger 모델 검증
+        _assert_afternoon_results(results)
         if results['intraday_rise']:
-            first_trigger = results['intraday_rise'][0]
-            assert first_trigger.trigger_type == 'intraday_rise', "trigger_type이 올바르지 않음"
-            assert first_trigger.session == 'afternoon', "session이 afternoon이어야 함"
             print("\n  ✓ Trigger 모델 검증 통과")
 
     except Exception as e:
         print(f"❌ 실패: {e}")
-        import traceback
         traceback.print_exc()
 
     print("\n" + "="*70)
@@ -193,4 +320,5 @@ async def test_trigger_service():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_trigger_service())
+    with asyncio.Runner() as runner:
+        runner.run(run_report(TriggerService(DataService())))
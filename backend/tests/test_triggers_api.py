@@ -8,8 +8,9 @@ import sys
 from pathlib import Path
 
 # 프로젝트 루트를 sys.path에 추가
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 import pytest
 from fastapi.testclient import TestClient
@@ -17,15 +18,32 @@ from datetime import datetime, timedelta
 
 from app.main import app
 
+pytestmark = pytest.mark.usefixtures("worker_db")
+
 client = TestClient(app)
 
+TODAY = datetime.now().strftime("%Y-%m-%d")
+WEEK_AGO = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+
+
+@pytest.fixture(scope="module")
+def morning_run():
+    """오전 트리거 1회 실행 (조회 테스트들이 공유)"""
+    return client.post("/api/v1/triggers/run/morning")
+
+
+@pytest.fixture(scope="module")
+def afternoon_run():
+    """오후 트리거 1회 실행"""
+    return client.post("/api/v1/triggers/run/afternoon")
+
 
 class TestTriggersAPI:
     """triggers.py API 엔드포인트 테스트"""
 
-    def test_run_trigger_morning(self):
+    def test_run_trigger_morning(self, morning_run):
         """POST /run/morning - 오전 트리거 수동 실행"""
-        response = client.post("/api/v1/triggers/run/morning")
+        response = morning_run
 
         assert response.status_code == 200
         data = response.json()
@@ -42,14 +60,11 @@ class TestTriggersAPI:
         for trigger_type in expected_types:
             assert trigger_type in breakdown
 
+    @pytest.mark.usefixtures("morning_run")
     def test_get_triggers_with_date(self):
         """GET / - 날짜별 트리거 조회"""
-        # 먼저 오전 트리거 실행
-        client.post("/api/v1/triggers/run/morning")
-
         # 오늘 날짜로 조회
-        today = datetime.now().strftime("%Y-%m-%d")
-        response = client.get(f"/api/v1/triggers?date={today}")
+        response = client.get(f"/api/v1/triggers?date={TODAY}")
 
         assert response.status_code == 200
         data = response.json()
@@ -57,16 +72,13 @@ class TestTriggersAPI:
         assert data["success"] is True
         assert "triggers" in data["data"]
         assert "metadata" in data["data"]
-        assert data["data"]["metadata"]["date"] == today
+        assert data["data"]["metadata"]["date"] == TODAY
 
+    @pytest.mark.usefixtures("morning_run")
     def test_get_triggers_with_session_filter(self):
         """GET / - 세션 필터링 트리거 조회"""
-        # 오전 트리거 실행
-        client.post("/api/v1/triggers/run/morning")
-
         # 오전 세션으로 필터링
-        today = datetime.now().strftime("%Y-%m-%d")
-        response = client.get(f"/api/v1/triggers?date={today}&session=morning")
+        response = client.get(f"/api/v1/triggers?date={TODAY}&session=morning")
 
         assert response.status_code == 200
         data = response.json()
@@ -78,11 +90,9 @@ class TestTriggersAPI:
         for trigger in data["data"]["triggers"]:
             assert trigger["session"] == "morning"
 
+    @pytest.mark.usefixtures("morning_run")
     def test_get_latest_triggers(self):
         """GET /latest - 최신 트리거 조회"""
-        # 먼저 트리거 실행
-        client.post("/api/v1/triggers/run/morning")
-
         response = client.get("/api/v1/triggers/latest")
 
         assert response.status_code == 200
@@ -97,38 +107,32 @@ class TestTriggersAPI:
         assert "session" in data["data"]["metadata"]
         assert "total" in data["data"]["metadata"]
 
+    @pytest.mark.usefixtures("morning_run")
     def test_get_triggers_by_type(self):
         """GET /types/{trigger_type} - 트리거 타입별 조회"""
-        # 오전 트리거 실행
-        client.post("/api/v1/triggers/run/morning")
-
         # volume_surge 타입만 조회
-        today = datetime.now().strftime("%Y-%m-%d")
-        response = client.get(f"/api/v1/triggers/types/volume_surge?date={today}&limit=3")
+        response = client.get(f"/api/v1/triggers/types/volume_surge?date={TODAY}&limit=3")
 
         assert response.status_code == 200
         data = response.json()
 
         assert data["success"] is True
         assert data["data"]["trigger_type"] == "volume_surge"
-        assert data["data"]["date"] == today
+        assert data["data"]["date"] == TODAY
         assert len(data["data"]["triggers"]) <= 3
 
         # 모든 트리거가 volume_surge 타입인지 확인
         for trigger in data["data"]["triggers"]:
             assert trigger["trigger_type"] == "volume_surge"
 
-    def test_get_trigger_history_for_stock(self):
+    def test_get_trigger_history_for_stock(self, morning_run):
         """GET /{ticker}/history - 종목별 트리거 히스토리"""
-        # 오전 트리거 실행
-        run_response = client.post("/api/v1/triggers/run/morning")
-        run_data = run_response.json()
+        run_data = morning_run.json()
 
         # 첫 번째 종목의 ticker를 가져옴
         if run_data["data"]["triggers_detected"] > 0:
             # 오늘 날짜 트리거 조회
-            today = datetime.now().strftime("%Y-%m-%d")
-            triggers_response = client.get(f"/api/v1/triggers?date={today}")
+            triggers_response = client.get(f"/api/v1/triggers?date={TODAY}")
             triggers_data = triggers_response.json()
 
             if len(triggers_data["data"]["triggers"]) > 0:
@@ -147,11 +151,9 @@ class TestTriggersAPI:
                 assert "trigger_breakdown" in data["data"]
                 assert "triggers" in data["data"]
 
+    @pytest.mark.usefixtures("morning_run")
     def test_get_trigger_stats(self):
         """GET /stats - 트리거 통계 조회"""
-        # 오전 트리거 실행
-        client.post("/api/v1/triggers/run/morning")
-
         # 최근 30일 통계 조회
         response = client.get("/api/v1/triggers/stats")
 
@@ -166,27 +168,22 @@ class TestTriggersAPI:
         assert "by_session" in data["data"]
         assert "top_frequent_stocks" in data["data"]
 
+    @pytest.mark.usefixtures("morning_run")
     def test_get_trigger_stats_with_date_range(self):
         """GET /stats - 날짜 범위 지정 통계 조회"""
-        # 오전 트리거 실행
-        client.post("/api/v1/triggers/run/morning")
-
         # 특정 기간 통계 조회
-        end_date = datetime.now().strftime("%Y-%m-%d")
-        start_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-
-        response = client.get(f"/api/v1/triggers/stats?start_date={start_date}&end_date={end_date}")
+        response = client.get(f"/api/v1/triggers/stats?start_date={WEEK_AGO}&end_date={TODAY}")
 
         assert response.status_code == 200
         data = response.json()
 
         assert data["success"] is True
-        assert data["data"]["period"]["start"] == start_date
-        assert data["data"]["period"]["end"] == end_date
+        assert data["data"]["period"]["start"] == WEEK_AGO
+        assert data["data"]["period"]["end"] == TODAY
 
-    def test_run_trigger_afternoon(self):
+    def test_run_trigger_afternoon(self, afternoon_run):
         """POST /run/afternoon - 오후 트리거 수동 실행"""
-        response = client.post("/api/v1/triggers/run/afternoon")
+        response = afternoon_run
 
         assert response.status_code == 200
         data = response.json()
@@ -4,6 +4,7 @@ Configuration settings for Price Poller Service
 환경 변수를 통해 설정을 관리합니다.
 """
 
+from functools import cached_property
 from pydantic_settings import BaseSettings
 from pathlib import Path
 
@@ -23,10 +24,11 @@ class Settings(BaseSettings):
     KIS_APP_KEY: str
     KIS_APP_SECRET: str
     KIS_IS_MOCK: bool = True
+    KIS_TOKEN_CACHE_PATH: str = "/app/data/.kis_token.json"  # OAuth 토큰 파일 캐시 (재시작 시 재사용)
 
-    @property
+    @cached_property
     def KIS_BASE_URL(self) -> str:
-        """KIS API Base URL (Mock or Real)"""
+        """KIS API Base URL (Mock or Real), 최초 접근 시 1회 계산"""
         if self.KIS_IS_MOCK:
             return "https://openapivts.koreainvestment.com:29443"  # Mock trading
         else:
@@ -36,6 +38,8 @@ class Settings(BaseSettings):
     POLLING_INTERVAL: float = 0.5  # 초 (초당 2건 제한 준수)
     BATCH_SIZE: int = 30  # 멀티종목 시세조회 최대 30개
     CYCLE_COMPLETE_DELAY: float = 0.5  # 사이클 완료 후 대기 시간
+    MAX_IN_FLIGHT_REQUESTS: int = 2  # 응답 대기 중인 API 호출 최대 수 (호출 시작 간격은 POLLING_INTERVAL 유지)
+    DB_WRITE_WINDOW: float = 0.5  # 첫 배치 도착 후 이 시간 동안 들어온 배치를 모아 1회 커밋 (0이면 즉시 저장)
 
     # Data staleness
     REALTIME_PRICE_STALENESS_THRESHOLD: int = 300  # 5분 (초)
@@ -4,33 +4,45 @@ Database operations for Price Poller Service
 SQLAlchemy를 사용하여 realtime_prices 테이블에 데이터를 씁니다.
 """
 
-from sqlalchemy import create_engine, Column, String, Float, Integer, DateTime, Index, event, text
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import create_engine, Column, String, Float, Integer, DateTime, event, text, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import logging
+import time
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# 필터 통과 종목 캐시 유효 시간 (초)
+FILTERED_TICKERS_TTL = 60
+
 # Database setup
 engine = create_engine(
     settings.DATABASE_URL,
     connect_args={
         "check_same_thread": False,
         "timeout": 30
-    }
+    },
+    pool_size=4,  # 배치 쓰기/종목 조회가 각자 짧게 커넥션 사용
+    max_overflow=0
 )
 
-# Enable WAL mode for better concurrency using event listener
+# Enable WAL mode and cache/mmap tuning using event listener
 @event.listens_for(engine, "connect")
 def set_sqlite_pragma(dbapi_conn, connection_record):
     cursor = dbapi_conn.cursor()
     cursor.execute("PRAGMA journal_mode=WAL")
     cursor.execute("PRAGMA synchronous=NORMAL")
     cursor.execute("PRAGMA busy_timeout=30000")
+    # 0.5초 주기 쓰기 부하: 페이지 캐시/메모리 맵으로 핫 페이지 상주, 체크포인트 빈도 완화
+    cursor.execute("PRAGMA cache_size=-65536")  # 64MB 페이지 캐시 (음수 = KiB 단위)
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256MB
+    cursor.execute("PRAGMA wal_autocheckpoint=10000")  # 10000 페이지마다 체크포인트 (기본 1000)
     cursor.close()
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -41,7 +53,7 @@ class RealtimePrice(Base):
     """실시간 주가 테이블"""
     __tablename__ = 'realtime_prices'
 
-    ticker = Column(String(10), primary_key=True, index=True)
+    ticker = Column(String(10), primary_key=True)  # PK 자동 인덱스로 조회, 별도 인덱스 없음
     current_price = Column(Integer, nullable=False)
     change_rate = Column(Float, nullable=False)
     change_amount = Column(Integer, nullable=False)
@@ -55,11 +67,39 @@ class RealtimePrice(Base):
     updated_at = Column(DateTime, nullable=False, index=True)
     created_at = Column(DateTime, default=datetime.now)
 
-    __table_args__ = (
-        Index('idx_ticker_updated', 'ticker', 'updated_at'),
+
+# UPSERT 충돌 시 갱신할 컬럼 (ticker/data_source/created_at 제외)
+_UPSERT_UPDATE_COLUMNS = (
+    'current_price', 'change_rate', 'change_amount', 'volume',
+    'open_price', 'high_price', 'low_price', 'trading_value',
+    'market_status', 'updated_at',
+)
+
+
+def _build_upsert_stmt():
+    """realtime_prices UPSERT 문 (Core, 행 리스트와 함께 executemany로 실행)"""
+    stmt = sqlite_insert(RealtimePrice.__table__)
+    return stmt.on_conflict_do_update(
+        index_elements=['ticker'],
+        set_={column: stmt.excluded[column] for column in _UPSERT_UPDATE_COLUMNS}
     )
 
 
+# 이전 스키마의 중복 인덱스 (ticker PK 자동 인덱스와 선두 컬럼 중복) - 쓰기마다 B-tree 갱신 비용만 발생
+_REDUNDANT_INDEXES = ('ix_realtime_prices_ticker', 'idx_ticker_updated')
+
+# 변경 여부 비교 대상 컬럼 (updated_at은 분 단위로 따로 비교)
+_DIRTY_CHECK_COLUMNS = tuple(c for c in _UPSERT_UPDATE_COLUMNS if c != 'updated_at')
+
+# 멀티종목 시세 응답 중 테이블에 없는 동시호가 전용 필드 (DB 저장 전 제거)
+_CALL_AUCTION_ONLY_FIELDS = frozenset((
+    'prev_close_price', 'expected_diff', 'expected_change_rate', 'expected_volume',
+))
+
+# 모듈 로드 시 1회 생성, 매 배치 재사용 (SQLAlchemy 컴파일 캐시 적중)
+_UPSERT_STMT = _build_upsert_stmt()
+
+
 class FinancialData(Base):
     """재무 데이터 테이블 (읽기 전용)"""
     __tablename__ = 'financial_data'
@@ -70,40 +110,63 @@ class FinancialData(Base):
 
 
 class DatabaseWriter:
-    """Database write operations"""
+    """
+    Database write operations
+
+    장기 세션을 유지하지 않고 작업마다 커넥션 풀에서 짧은 트랜잭션을 엽니다.
+    (identity map 누적 없음, 조회가 쓰기 세션 상태에 묶이지 않음)
+    """
 
     def __init__(self):
-        self.session: Optional[Session] = None
+        self.connected = False
+        self._filtered_tickers_cache: Optional[Tuple[float, List[str]]] = None  # (조회 시각, 티커 리스트)
+        self._last_written: Dict[str, tuple] = {}  # ticker → 마지막 저장 값 (변경 없는 행 쓰기 생략)
 
     def connect(self):
-        """Open database session"""
-        self.session = SessionLocal()
+        """Database 연결 확인"""
+        with engine.begin() as conn:
+            conn.execute(text("SELECT 1"))
+
+            # 기존 DB의 중복 인덱스 제거 (1회성, 이후 no-op)
+            for index_name in _REDUNDANT_INDEXES:
+                conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+        self.connected = True
         logger.info("✅ Database connection opened")
 
     def close(self):
-        """Close database session"""
-        if self.session:
-            self.session.close()
+        """커넥션 풀 정리"""
+        if self.connected:
+            engine.dispose()
+            self.connected = False
             logger.info("Database connection closed")
 
     def get_filtered_tickers(self) -> List[str]:
         """
         필터 통과 종목 조회 (filter_status='pass')
 
+        FILTERED_TICKERS_TTL초 동안 결과를 재사용합니다. (시작 시 main/poll_forever 중복 조회 등)
+
         Returns:
             티커 리스트 (예: ['005930', '000660', ...])
         """
-        if not self.session:
+        if not self.connected:
             raise RuntimeError("Database not connected")
 
+        if self._filtered_tickers_cache:
+            cached_at, tickers = self._filtered_tickers_cache
+            if time.monotonic() - cached_at < FILTERED_TICKERS_TTL:
+                return list(tickers)
+
         try:
-            results = self.session.query(FinancialData.ticker).filter(
-                FinancialData.filter_status == 'pass'
-            ).all()
+            with engine.connect() as conn:
+                tickers = list(conn.execute(
+                    select(FinancialData.ticker).where(FinancialData.filter_status == 'pass')
+                ).scalars())
 
-            tickers = [r.ticker for r in results]
             logger.info(f"📊 필터 통과 종목 {len(tickers)}개 조회")
-            return tickers
+            if tickers:
+                self._filtered_tickers_cache = (time.monotonic(), tickers)
+            return list(tickers)
 
         except Exception as e:
             logger.error(f"❌ 필터 종목 조회 실패: {e}")
@@ -131,32 +194,15 @@ class DatabaseWriter:
         Returns:
             성공 여부
         """
-        if not self.session:
+        if not self.connected:
             raise RuntimeError("Database not connected")
 
         try:
-            # Check if record exists
-            existing = self.session.query(RealtimePrice).filter_by(ticker=ticker).first()
-
-            if existing:
-                # Update existing record
-                for key, value in price_data.items():
-                    if hasattr(existing, key):
-                        setattr(existing, key, value)
-            else:
-                # Insert new record
-                new_price = RealtimePrice(
-                    ticker=ticker,
-                    data_source='kis',
-                    **price_data
-                )
-                self.session.add(new_price)
-
-            self.session.commit()
+            with engine.begin() as conn:
+                conn.execute(_UPSERT_STMT, [{'ticker': ticker, 'data_source': 'kis', **price_data}])
             return True
 
         except Exception as e:
-            self.session.rollback()
             logger.error(f"❌ {ticker} 가격 업데이트 실패: {e}")
             return False
 
@@ -168,30 +214,68 @@ class DatabaseWriter:
         """
         배치 가격 업데이트 (시간대별 필드 매핑)
 
+        배치 전체를 INSERT ... ON CONFLICT(ticker) DO UPDATE executemany 1회 + commit 1회로 저장합니다.
+        (종목별 SELECT → UPDATE/INSERT → commit 반복 제거, ORM 객체 생성 없음)
+
+        마지막 저장 이후 값이 바뀌지 않은 종목은 건너뜁니다. 단, updated_at의 분이
+        바뀌면 다시 저장하여 조회 측 신선도(staleness) 판단에 걸리지 않게 합니다.
+
         Args:
             batch_data: {ticker: price_data, ...}
             session: 현재 거래 시간대 (동시호가 시 예상 체결가 사용)
 
         Returns:
-            성공한 종목 수
+            성공한 종목 수 (변경 없어 생략한 종목 포함, 실패 시 0)
         """
-        success_count = 0
+        if not self.connected:
+            raise RuntimeError("Database not connected")
+
+        if not batch_data:
+            return 0
+
         is_call_auction = session in ['장_시작_동시호가', '장_마감_동시호가']
 
-        for ticker, price_data in batch_data.items():
-            # 동시호가 시간대: 예상 체결가로 대체
-            if is_call_auction:
-                price_data = self._apply_call_auction_mapping(price_data)
+        # 동시호가 시간대: 예상 체결가로 대체 (분기는 배치당 1회)
+        if is_call_auction:
+            items = [
+                (ticker, self._apply_call_auction_mapping(price_data))
+                for ticker, price_data in batch_data.items()
+            ]
+        else:
+            items = batch_data.items()
+
+        # DB 저장 전 동시호가 필드 제거 (테이블에 없는 컬럼)
+        rows = [
+            {'ticker': ticker, 'data_source': 'kis',
+             **{k: v for k, v in price_data.items() if k not in _CALL_AUCTION_ONLY_FIELDS}}
+            for ticker, price_data in items
+        ]
+
+        # 변경된 종목만 저장 (장 마감 후/거래 소강 시 대부분 생략)
+        changed = []
+        for row in rows:
+            updated_at = row.get('updated_at')
+            key = tuple(row.get(c) for c in _DIRTY_CHECK_COLUMNS) + (
+                updated_at.replace(second=0, microsecond=0) if updated_at else None,
+            )
+            if self._last_written.get(row['ticker']) != key:
+                changed.append((row, key))
+
+        if not changed:
+            logger.debug(f"변경 없음 - {len(rows)}개 종목 저장 생략")
+            return len(rows)
 
-            # DB 저장 전 동시호가 필드 제거 (테이블에 없는 컬럼)
-            clean_data = {k: v for k, v in price_data.items()
-                         if k not in ['prev_close_price', 'expected_diff',
-                                     'expected_change_rate', 'expected_volume']}
+        try:
+            with engine.begin() as conn:
+                conn.execute(_UPSERT_STMT, [row for row, _ in changed])
 
-            if self.update_realtime_price(ticker, clean_data):
-                success_count += 1
+            for row, key in changed:
+                self._last_written[row['ticker']] = key
+            return len(rows)
 
-        return success_count
+        except Exception as e:
+            logger.error(f"❌ 배치 가격 업데이트 실패 ({len(changed)}개): {e}")
+            return 0
 
     def _apply_call_auction_mapping(self, price_data: Dict[str, Any]) -> Dict[str, Any]:
         """
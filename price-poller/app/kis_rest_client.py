@@ -4,15 +4,18 @@ KIS REST API Client
 한국투자증권 REST API를 사용하여 멀티종목 시세를 조회합니다.
 
 Features:
-- OAuth 토큰 발급/갱신 (24시간 유효)
+- OAuth 토큰 발급/갱신 (24시간 유효, 파일 캐시로 재시작 시 재사용)
 - 멀티종목 시세조회 (최대 30개/호출)
 - API 호출 제한 준수 (초당 2건)
 - 에러 핸들링 및 재시도
 """
 
+import asyncio
 import httpx
 import logging
+import orjson
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import List, Dict, Optional, Any
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
@@ -20,6 +23,56 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 (h2 설치 시): 동시 배치 요청을 하나의 TLS 연결에서 다중화
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# 멀티종목 시세조회 API 제한 (호출당 최대 종목 수)
+MAX_TICKERS_PER_CALL = 30
+
+MULTI_QUOTE_ENDPOINT = "/uapi/domestic-stock/v1/quotations/intstock-multprice"
+MULTI_QUOTE_TR_ID = "FHKST11300006"  # 관심종목(멀티종목) 시세조회, 실전 전용 (모의투자 미지원)
+
+# 멀티종목 시세조회 파라미터 키 (FID_COND_MRKT_DIV_CODE_N, FID_INPUT_ISCD_N), 호출마다 포맷하지 않도록 미리 생성
+_MULTI_QUOTE_PARAM_KEYS = tuple(
+    (f"FID_COND_MRKT_DIV_CODE_{idx}", f"FID_INPUT_ISCD_{idx}")
+    for idx in range(1, MAX_TICKERS_PER_CALL + 1)
+)
+
+
+# KIS 토큰 만료 응답 코드
+TOKEN_EXPIRED_MSG_CD = "EGW00123"
+
+# 관심종목 API 응답 필드 매핑: (결과 키, KIS 필드, 변환 함수)
+_MULTI_QUOTE_FIELDS = (
+    ('current_price', 'inter2_prpr', int),  # 관심2 현재가
+    ('change_rate', 'prdy_ctrt', float),  # 전일대비율
+    ('change_amount', 'inter2_prdy_vrss', int),  # 관심2 전일대비
+    ('volume', 'acml_vol', int),  # 누적거래량
+    ('open_price', 'inter2_oprc', int),  # 관심2 시가
+    ('high_price', 'inter2_hgpr', int),  # 관심2 고가
+    ('low_price', 'inter2_lwpr', int),  # 관심2 저가
+    ('trading_value', 'acml_tr_pbmn', int),  # 누적거래대금 (원)
+)
+
+# 동시호가 관련 필드 (08:40~09:00, 15:20~15:30), 빈 값이면 0
+_MULTI_QUOTE_AUCTION_FIELDS = (
+    ('prev_close_price', 'inter2_prdy_clpr', int),  # 전일 종가
+    ('expected_diff', 'intr_antc_cntg_vrss', int),  # 예상 체결 대비
+    ('expected_change_rate', 'intr_antc_cntg_prdy_ctrt', float),  # 예상 등락률
+    ('expected_volume', 'intr_antc_vol', int),  # 예상 거래량
+)
+
+# 관심종목 API 시간 구분 코드(hour_cls_code) → market_status
+_MARKET_STATUS_BY_HOUR_CLS = {
+    "0": "open",  # 정규장
+    "1": "pre_market",  # 장전
+    "2": "after_hours",  # 장후
+}
+
 
 class KISRestClient:
     """KIS REST API 클라이언트"""
@@ -29,11 +82,23 @@ class KISRestClient:
         self.app_key = settings.KIS_APP_KEY
         self.app_secret = settings.KIS_APP_SECRET
         self.is_mock = settings.KIS_IS_MOCK
+        self.multi_quote_url = f"{self.base_url}{MULTI_QUOTE_ENDPOINT}"
 
         self.access_token: Optional[str] = None
         self.token_expires_at: Optional[datetime] = None
-
-        self.client = httpx.AsyncClient(timeout=10.0)
+        self.multi_quote_headers: Dict[str, str] = {}  # 토큰 발급 시 1회 생성
+        self.token_cache_path = Path(settings.KIS_TOKEN_CACHE_PATH)
+        self._token_lock = asyncio.Lock()  # 동시 배치 호출 시 토큰 중복 발급 방지 (1분당 1회 제한)
+
+        self.client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=20,
+                max_keepalive_connections=20,
+                keepalive_expiry=60.0  # 사이클 사이 대기/재시도 백오프 후에도 TLS 연결 재사용
+            ),
+            timeout=httpx.Timeout(10.0, connect=2.0)
+        )
 
     async def close(self):
         """Close HTTP client"""
@@ -49,6 +114,15 @@ class KISRestClient:
         Raises:
             Exception: 토큰 발급 실패
         """
+        async with self._token_lock:
+            return await self._get_access_token()
+
+    async def _get_access_token(self) -> str:
+        """토큰 재사용 또는 발급 (_token_lock 보유 상태에서 호출)"""
+        # 프로세스 재시작 직후: 파일에 저장된 토큰 로드 (토큰 발급은 1분당 1회 제한)
+        if not self.access_token:
+            self._load_token()
+
         # 토큰이 유효하면 재사용
         if self.access_token and self.token_expires_at:
             if datetime.now() < self.token_expires_at - timedelta(hours=1):
@@ -69,7 +143,7 @@ class KISRestClient:
             response = await self.client.post(url, json=payload)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # OAuth tokenP API는 rt_cd 없이 access_token만 반환
             if "access_token" not in data:
@@ -78,6 +152,8 @@ class KISRestClient:
             self.access_token = data["access_token"]
             # 토큰 유효기간: 24시간 (여유 1시간)
             self.token_expires_at = datetime.now() + timedelta(hours=23)
+            self._build_headers()
+            self._save_token()
 
             logger.info(f"✅ OAuth 토큰 발급 완료 (만료: {self.token_expires_at.strftime('%Y-%m-%d %H:%M')})")
             return self.access_token
@@ -89,15 +165,78 @@ class KISRestClient:
             logger.error(f"❌ 토큰 발급 실패: {e}")
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((httpx.HTTPError, httpx.TimeoutException))
-    )
+    def _build_headers(self):
+        """멀티종목 시세조회 헤더 생성 (토큰이 바뀔 때만 호출)"""
+        self.multi_quote_headers = {
+            "authorization": f"Bearer {self.access_token}",
+            "appkey": self.app_key,
+            "appsecret": self.app_secret,
+            "tr_id": MULTI_QUOTE_TR_ID,
+            "custtype": "P"
+        }
+
+    def _load_token(self) -> bool:
+        """저장된 토큰 로드 (같은 앱키/모드로 발급되고 만료 전인 경우만)"""
+        if not self.token_cache_path.exists():
+            return False
+
+        try:
+            data = orjson.loads(self.token_cache_path.read_bytes())
+
+            if data.get("app_key") != self.app_key or data.get("is_mock") != self.is_mock:
+                logger.info("저장된 토큰의 앱키/모드가 달라 사용하지 않습니다.")
+                return False
+
+            expires_at = datetime.fromisoformat(data["expires_at"])
+            if datetime.now() >= expires_at - timedelta(hours=1):
+                logger.info("저장된 토큰이 만료되었습니다.")
+                return False
+
+            self.access_token = data["access_token"]
+            self.token_expires_at = expires_at
+            self._build_headers()
+
+            logger.info(f"✅ 저장된 토큰 로드 (만료: {expires_at.strftime('%Y-%m-%d %H:%M')})")
+            return True
+
+        except Exception as e:
+            logger.warning(f"토큰 파일 로드 실패: {e}")
+            return False
+
+    def _save_token(self):
+        """토큰 파일 저장 (임시 파일에 쓴 뒤 교체, 소유자만 읽기 가능)"""
+        try:
+            data = {
+                "access_token": self.access_token,
+                "expires_at": self.token_expires_at.isoformat(),
+                "app_key": self.app_key,
+                "is_mock": self.is_mock,
+            }
+            self.token_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.token_cache_path.with_suffix(".tmp")
+            tmp_path.write_bytes(orjson.dumps(data))
+            tmp_path.chmod(0o600)
+            tmp_path.replace(self.token_cache_path)
+        except Exception as e:
+            logger.warning(f"토큰 파일 저장 실패: {e}")
+
+    def _invalidate_token(self):
+        """토큰 폐기 (메모리 + 파일), 다음 호출에서 재발급"""
+        logger.warning("⚠️ 토큰 만료/무효 - 다음 호출 시 재발급")
+        self.access_token = None
+        self.token_expires_at = None
+        try:
+            self.token_cache_path.unlink(missing_ok=True)
+        except Exception as e:
+            logger.warning(f"토큰 파일 삭제 실패: {e}")
+
     async def get_multi_quote(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
         """
         멀티종목 시세조회 (최대 30개) - 관심종목 API 사용
 
+        재시도하지 않습니다. 재시도도 호출 간격(초당 2건)을 지켜야 하므로
+        PollingManager가 호출 간격 제어와 함께 수행합니다.
+
         Args:
             tickers: 종목 코드 리스트 (최대 30개)
 
@@ -121,48 +260,43 @@ class KISRestClient:
         Raises:
             Exception: API 호출 실패
         """
-        if len(tickers) > 30:
-            raise ValueError("멀티종목 시세조회는 최대 30개까지 가능합니다")
+        if len(tickers) > MAX_TICKERS_PER_CALL:
+            raise ValueError(f"멀티종목 시세조회는 최대 {MAX_TICKERS_PER_CALL}개까지 가능합니다")
 
-        # 토큰 확인/갱신
-        token = await self.get_access_token()
+        # 토큰 확인/갱신 (헤더도 함께 갱신됨)
+        await self.get_access_token()
 
         # 관심종목(멀티종목) 시세조회 API - 정규장 전용
         # (시간 체크는 polling_manager에서 수행)
-        endpoint = "/uapi/domestic-stock/v1/quotations/intstock-multprice"
-        tr_id = "FHKST11300006"  # 실전 전용 (모의투자 미지원)
-
-        url = f"{self.base_url}{endpoint}"
-
-        headers = {
-            "authorization": f"Bearer {token}",
-            "appkey": self.app_key,
-            "appsecret": self.app_secret,
-            "tr_id": tr_id,
-            "custtype": "P"
-        }
+        url = self.multi_quote_url
+        headers = self.multi_quote_headers
 
         # 각 종목마다 2개의 파라미터 (FID_COND_MRKT_DIV_CODE_N, FID_INPUT_ISCD_N)
         params = {}
-        for idx, ticker in enumerate(tickers, start=1):
-            params[f"FID_COND_MRKT_DIV_CODE_{idx}"] = "J"  # J=코스피+코스닥+기타
-            params[f"FID_INPUT_ISCD_{idx}"] = ticker
+        for (market_key, ticker_key), ticker in zip(_MULTI_QUOTE_PARAM_KEYS, tickers):
+            params[market_key] = "J"  # J=코스피+코스닥+기타
+            params[ticker_key] = ticker
 
         try:
             response = await self.client.get(url, headers=headers, params=params)
 
             if response.status_code != 200:
                 logger.error(f"API 응답 실패 ({response.status_code}): {response.text}")
+                if TOKEN_EXPIRED_MSG_CD in response.text or response.status_code == 401:
+                    self._invalidate_token()
 
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)  # 폴링 주기마다 호출되는 경로 (stdlib json 대비 빠른 파싱)
 
             # API 응답 확인
             if data.get("rt_cd") != "0":
                 error_msg = data.get("msg1", "Unknown error")
                 logger.warning(f"⚠️ API 응답 오류: {error_msg}")
 
+                if data.get("msg_cd") == TOKEN_EXPIRED_MSG_CD:
+                    self._invalidate_token()
+
                 # 에러 코드별 처리
                 if "EGW00201" in error_msg or "429" in str(response.status_code):
                     # API 호출 제한 초과
@@ -179,6 +313,9 @@ class KISRestClient:
                 logger.warning(f"⚠️ 응답 데이터 없음: {tickers}")
                 return result
 
+            # 응답 1건의 종목들은 같은 시점 시세이므로 수신 시각을 1회만 계산
+            fetched_at = datetime.now()
+
             # 각 종목 데이터 파싱
             for item in output:
                 ticker = item.get("inter_shrn_iscd")  # 관심 단축 종목코드
@@ -186,54 +323,20 @@ class KISRestClient:
                     continue
 
                 try:
-                    # 가격 데이터
-                    current_price = int(item.get("inter2_prpr", 0))  # 관심2 현재가
-                    change_rate = float(item.get("prdy_ctrt", 0))  # 전일대비율
-                    change_amount = int(item.get("inter2_prdy_vrss", 0))  # 관심2 전일대비
-                    volume = int(item.get("acml_vol", 0))  # 누적거래량
-
-                    # OHLC
-                    open_price = int(item.get("inter2_oprc", 0))  # 관심2 시가
-                    high_price = int(item.get("inter2_hgpr", 0))  # 관심2 고가
-                    low_price = int(item.get("inter2_lwpr", 0))  # 관심2 저가
-
-                    # 거래 데이터
-                    trading_value = int(item.get("acml_tr_pbmn", 0))  # 누적거래대금 (원)
-
-                    # 동시호가 관련 데이터 (08:40~09:00, 15:20~15:30)
-                    prev_close_price = int(item.get("inter2_prdy_clpr", 0) or 0)  # 전일 종가
-                    expected_diff = int(item.get("intr_antc_cntg_vrss", 0) or 0)  # 예상 체결 대비
-                    expected_change_rate = float(item.get("intr_antc_cntg_prdy_ctrt", 0) or 0)  # 예상 등락률
-                    expected_volume = int(item.get("intr_antc_vol", 0) or 0)  # 예상 거래량
+                    # 가격/OHLC/거래 데이터
+                    row = {name: cast(item.get(key, 0)) for name, key, cast in _MULTI_QUOTE_FIELDS}
 
                     # 시장 상태 판단
-                    hour_cls_code = item.get("hour_cls_code", "0")
-                    if hour_cls_code == "0":
-                        market_status = "open"  # 정규장
-                    elif hour_cls_code == "1":
-                        market_status = "pre_market"  # 장전
-                    elif hour_cls_code == "2":
-                        market_status = "after_hours"  # 장후
-                    else:
-                        market_status = "closed"
-
-                    result[ticker] = {
-                        'current_price': current_price,
-                        'change_rate': change_rate,
-                        'change_amount': change_amount,
-                        'volume': volume,
-                        'open_price': open_price,
-                        'high_price': high_price,
-                        'low_price': low_price,
-                        'trading_value': trading_value,
-                        'market_status': market_status,
-                        'updated_at': datetime.now(),
-                        # 동시호가용 추가 필드
-                        'prev_close_price': prev_close_price,
-                        'expected_diff': expected_diff,
-                        'expected_change_rate': expected_change_rate,
-                        'expected_volume': expected_volume,
-                    }
+                    row['market_status'] = _MARKET_STATUS_BY_HOUR_CLS.get(
+                        item.get("hour_cls_code", "0"), "closed"
+                    )
+                    row['updated_at'] = fetched_at
+
+                    # 동시호가용 추가 필드
+                    for name, key, cast in _MULTI_QUOTE_AUCTION_FIELDS:
+                        row[name] = cast(item.get(key, 0) or 0)
+
+                    result[ticker] = row
 
                 except (ValueError, KeyError) as e:
                     logger.warning(f"⚠️ {ticker} 데이터 파싱 실패: {e}")
@@ -309,7 +412,7 @@ class KISRestClient:
             response = await self.client.get(url, headers=headers, params=params)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # API 응답 확인
             if data.get("rt_cd") != "0":
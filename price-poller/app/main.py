@@ -20,6 +20,11 @@ import logging
 import sys
 from datetime import datetime
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from app.config import settings
 from app.kis_rest_client import KISRestClient
 from app.database import DatabaseWriter
@@ -61,6 +66,7 @@ class PricePollerService:
         logger.info(f"Database: {settings.DATABASE_URL}")
         logger.info(f"Polling Interval: {settings.POLLING_INTERVAL}s")
         logger.info(f"Batch Size: {settings.BATCH_SIZE} stocks")
+        logger.info(f"Event Loop: {type(asyncio.get_running_loop()).__module__}")
         logger.info("=" * 60)
 
         try:
@@ -200,8 +206,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop 설치 시 uvloop 이벤트 루프 사용 (I/O 대기/콜백 처리 고속화), 없으면 기본 asyncio 루프
+    run = uvloop.run if uvloop is not None else asyncio.run
+
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         logger.info("⚠️ Keyboard interrupt received")
     except Exception as e:
@@ -7,8 +7,8 @@ Polling Manager
 Polling Strategy:
 1. financial_data에서 필터 통과 종목 로드
 2. 30개씩 배치로 분할
-3. 각 배치를 KIS Multi-Quote API로 조회 (0.5초 간격)
-4. realtime_prices 테이블에 업데이트
+3. 각 배치를 KIS Multi-Quote API로 조회 (호출 시작 기준 0.5초 간격, 재시도 포함, 최대 2건 동시 진행)
+4. realtime_prices 테이블에 업데이트 (단일 writer 태스크가 큐의 배치를 모아 저장)
 5. 전체 사이클 완료 (약 10초) → 즉시 다시 시작
 
 Note:
@@ -17,27 +17,75 @@ Note:
 """
 
 import asyncio
+import httpx
 import logging
-from typing import List
+from typing import List, Optional
 from datetime import datetime, timedelta
 import time
+from tenacity import AsyncRetrying, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from app.config import settings
-from app.kis_rest_client import KISRestClient
+from app.kis_rest_client import KISRestClient, MAX_TICKERS_PER_CALL
 from app.database import DatabaseWriter, split_into_batches
 
 logger = logging.getLogger(__name__)
 
+# DB 저장 대기 배치 최대 수 (가득 차면 폴링이 writer를 기다림)
+_WRITE_QUEUE_MAXSIZE = 64
+
+# 배치 조회 재시도 횟수 (첫 호출 포함)
+_QUOTE_ATTEMPTS = 3
+
 
 class PollingManager:
     """폴링 관리자"""
 
     def __init__(self):
-        self.batch_size = settings.BATCH_SIZE  # 30
+        self.batch_size = min(settings.BATCH_SIZE, MAX_TICKERS_PER_CALL)  # 30 (API 최대치 초과 방지)
         self.polling_interval = settings.POLLING_INTERVAL  # 0.5초
         self.cycle_complete_delay = settings.CYCLE_COMPLETE_DELAY  # 0.5초
+        self.max_in_flight = settings.MAX_IN_FLIGHT_REQUESTS  # 동시 진행 API 호출 수 (2)
+        self.write_window = settings.DB_WRITE_WINDOW  # DB 커밋 묶음 시간 (0.5초)
 
         self.is_running = False
+        self._stop_event = asyncio.Event()  # stop() 시 장기 대기(장 마감 대기 등) 즉시 해제
+
+        # API 호출 시작 간격 제어 (첫 호출과 재시도 모두 _paced_start()를 거침)
+        self._pace_lock = asyncio.Lock()
+        self._last_start: Optional[float] = None
+
+        # 단일 DB writer (배치 조회 태스크 → 큐 → writer 태스크 1개)
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._written = 0  # 현재 사이클 DB 저장 성공 종목 수
+        self._write_failed = 0  # 현재 사이클 DB 저장 실패 종목 수
+
+    async def _wait(self, seconds: float):
+        """
+        seconds 동안 대기하되 stop() 호출 시 즉시 반환
+
+        장 마감 후 수 시간 대기를 asyncio.sleep() 대신 이벤트로 기다려
+        종료 시 태스크 취소 없이도 바로 빠져나옵니다.
+        """
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _paced_start(self):
+        """
+        직전 API 호출 시작 후 polling_interval이 지날 때까지 대기
+
+        Lock이 대기 순서(FIFO)를 보장하므로 동시에 진행 중인 배치의 재시도도
+        초당 2건 제한 안에서 차례대로 발행됩니다.
+        """
+        async with self._pace_lock:
+            if self._last_start is not None:
+                remaining = self.polling_interval - (time.monotonic() - self._last_start)
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+
+            self._last_start = time.monotonic()
 
     async def poll_forever(
         self,
@@ -58,6 +106,7 @@ class PollingManager:
             Exception: 치명적인 오류 발생 시
         """
         self.is_running = True
+        self._stop_event.clear()
         logger.info("🚀 폴링 시작")
 
         # 필터 통과 종목 로드
@@ -69,6 +118,18 @@ class PollingManager:
 
         logger.info(f"📋 {len(tickers)}개 종목 추적")
 
+        try:
+            await self._run_sessions(kis_client, db_writer, tickers)
+        finally:
+            await self._stop_writer()
+
+    async def _run_sessions(
+        self,
+        kis_client: KISRestClient,
+        db_writer: DatabaseWriter,
+        tickers: List[str]
+    ):
+        """거래 시간대별 폴링/대기 반복 (poll_forever 본체)"""
         while self.is_running:
             # 현재 거래 시간대 확인
             session = get_trading_session()
@@ -83,7 +144,9 @@ class PollingManager:
                 logger.info(f"   다음 시작: {next_market_open.strftime('%Y-%m-%d %H:%M:%S')}")
                 logger.info(f"   대기 시간: {sleep_seconds / 3600:.1f}시간")
 
-                await asyncio.sleep(sleep_seconds)
+                await self._wait(sleep_seconds)
+                if not self.is_running:
+                    break
 
                 # 07:30 깨어나면 tickers 새로고침 (financial_data 00:00 업데이트 반영)
                 tickers = db_writer.get_filtered_tickers()
@@ -110,37 +173,42 @@ class PollingManager:
         # 배치 분할
         batches = split_into_batches(tickers, self.batch_size)
 
+        self._ensure_writer(db_writer)
+        self._written = 0
+        self._write_failed = 0
+
         cycle_start = time.time()
 
         logger.info(f"🔄 [{session}] 폴링 시작 ({len(batches)}개 배치)")
 
-        total_success = 0
-        total_failed = 0
+        # 응답 대기는 최대 max_in_flight개까지 겹치고, 호출 시작(재시도 포함)은
+        # _paced_start()로 0.5초 간격 유지 (초당 2건 제한)
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        tasks = []
 
-        # 각 배치 순차 처리
-        for batch_index, batch in enumerate(batches, start=1):
-            try:
-                # KIS 멀티 API 호출
-                prices = await kis_client.get_multi_quote(batch)
+        try:
+            for batch_index, batch in enumerate(batches, start=1):
+                await semaphore.acquire()
 
-                if not prices:
-                    logger.warning(f"  ⚠️ 배치 {batch_index}/{len(batches)}: 응답 없음")
-                    total_failed += len(batch)
-                else:
-                    # DB 업데이트 (session 전달하여 동시호가 처리)
-                    success_count = db_writer.batch_update_realtime_prices(prices, session)
-                    failed_count = len(batch) - success_count
+                tasks.append(asyncio.create_task(
+                    self._poll_batch(
+                        kis_client, batch, session,
+                        f"{batch_index}/{len(batches)}", semaphore
+                    )
+                ))
 
-                    total_success += success_count
-                    total_failed += failed_count
+            missing_counts = await asyncio.gather(*tasks)
 
-            except Exception as e:
-                logger.error(f"  ❌ 배치 {batch_index}/{len(batches)} 실패: {e}")
-                total_failed += len(batch)
+            # 이번 사이클 배치가 모두 DB에 저장될 때까지 대기
+            await self._write_queue.join()
+
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            raise
 
-            # API 제한 준수 (0.5초 대기)
-            if batch_index < len(batches):  # 마지막 배치가 아니면
-                await asyncio.sleep(self.polling_interval)
+        total_success = self._written
+        total_failed = sum(missing_counts) + self._write_failed
 
         cycle_time = time.time() - cycle_start
 
@@ -152,10 +220,112 @@ class PollingManager:
         # 사이클 완료 후 짧은 대기
         await asyncio.sleep(self.cycle_complete_delay)
 
+    async def _poll_batch(
+        self,
+        kis_client: KISRestClient,
+        batch: List[str],
+        session: str,
+        label: str,
+        semaphore: asyncio.Semaphore
+    ) -> int:
+        """
+        배치 1개 조회 후 DB 저장 큐에 적재 (완료 시 semaphore 슬롯 반환)
+
+        HTTP 오류/타임아웃은 최대 _QUOTE_ATTEMPTS회까지 재시도하며, 재시도 호출도
+        _paced_start()를 거쳐 다른 배치와 같은 호출 간격을 지킵니다.
+
+        Returns:
+            응답에서 누락/실패한 종목 수
+        """
+        try:
+            # KIS 멀티 API 호출 (백오프 후 재시도도 호출 간격 제어 경유)
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(_QUOTE_ATTEMPTS),
+                wait=wait_exponential(multiplier=1, min=2, max=10),
+                retry=retry_if_exception_type((httpx.HTTPError, httpx.TimeoutException)),
+                reraise=True
+            ):
+                with attempt:
+                    await self._paced_start()
+                    prices = await kis_client.get_multi_quote(batch)
+
+            if not prices:
+                logger.warning(f"  ⚠️ 배치 {label}: 응답 없음")
+                return len(batch)
+
+            # DB 업데이트는 writer 태스크에 위임 (session 전달하여 동시호가 처리)
+            await self._write_queue.put((prices, session))
+            return len(batch) - len(prices)
+
+        except Exception as e:
+            logger.error(f"  ❌ 배치 {label} 실패: {e}")
+            return len(batch)
+
+        finally:
+            semaphore.release()
+
+    def _ensure_writer(self, db_writer: DatabaseWriter):
+        """DB writer 태스크가 없으면 시작"""
+        if self._writer_task is None or self._writer_task.done():
+            self._write_queue = asyncio.Queue(maxsize=_WRITE_QUEUE_MAXSIZE)
+            self._writer_task = asyncio.create_task(self._writer_loop(db_writer))
+
+    async def _stop_writer(self):
+        """DB writer 태스크 종료"""
+        if self._writer_task and not self._writer_task.done():
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+        self._writer_task = None
+
+    async def _writer_loop(self, db_writer: DatabaseWriter):
+        """
+        단일 DB writer
+
+        첫 배치 도착 후 write_window 동안 들어온 배치까지 모두 꺼내 합친 뒤
+        한 트랜잭션으로 저장합니다. (폴링 윈도우당 커밋 1회)
+        (쓰기 주체가 하나뿐이라 SQLite 쓰기 락 경합/SQLITE_BUSY 없음,
+        동기 SQLAlchemy 쓰기는 스레드에서 실행되어 API 응답 대기와 겹침)
+        큐는 사이클마다 비워지므로 한 번에 합쳐지는 배치는 같은 거래 시간대입니다.
+        """
+        queue = self._write_queue
+
+        while True:
+            prices, session = await queue.get()
+
+            # 같은 윈도우에 도착하는 배치를 모아 커밋 횟수 축소
+            if self.write_window > 0:
+                await asyncio.sleep(self.write_window)
+
+            merged = dict(prices)
+            item_count = 1
+
+            while not queue.empty():
+                more_prices, _ = queue.get_nowait()
+                merged.update(more_prices)
+                item_count += 1
+
+            try:
+                success_count = await asyncio.to_thread(
+                    db_writer.batch_update_realtime_prices, merged, session
+                )
+            except Exception as e:
+                logger.error(f"  ❌ DB 저장 실패 ({len(merged)}개): {e}")
+                success_count = 0
+
+            self._written += success_count
+            self._write_failed += len(merged) - success_count
+
+            for _ in range(item_count):
+                queue.task_done()
+
     def stop(self):
         """폴링 중지"""
         logger.info("🛑 폴링 중지 요청")
         self.is_running = False
+        self._stop_event.set()
 
 
 def get_trading_session() -> str:
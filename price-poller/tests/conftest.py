@@ -0,0 +1,15 @@
+"""
+공용 pytest 설정
+
+app.config.Settings가 import 시점에 KIS 앱키를 요구하므로 테스트용 값을 먼저 설정합니다.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# price-poller 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("KIS_APP_KEY", "test-app-key")
+os.environ.setdefault("KIS_APP_SECRET", "test-app-secret")
@@ -0,0 +1,115 @@
+"""
+KISRestClient 토큰 파일 캐시 테스트
+
+pytest price-poller/tests/test_kis_token_cache.py -v
+"""
+
+import asyncio
+import stat
+from datetime import datetime, timedelta
+
+import orjson
+import pytest
+
+from app.config import settings
+from app.kis_rest_client import KISRestClient
+
+
+@pytest.fixture
+def make_client(tmp_path, monkeypatch):
+    """토큰 캐시 경로를 tmp_path로 지정한 KISRestClient 생성"""
+    monkeypatch.setattr(settings, "KIS_TOKEN_CACHE_PATH", str(tmp_path / ".kis_token.json"))
+    clients = []
+
+    def _make():
+        client = KISRestClient()
+        clients.append(client)
+        return client
+
+    yield _make
+
+    for client in clients:
+        asyncio.run(client.close())
+
+
+def _issue_token(client, expires_in: timedelta, token: str = "cached-token"):
+    """토큰 발급 응답을 받은 상태로 만들고 파일에 저장"""
+    client.access_token = token
+    client.token_expires_at = datetime.now() + expires_in
+    client._save_token()
+
+
+def test_load_saved_token(make_client):
+    """저장된 토큰을 새 클라이언트(재시작)에서 로드"""
+    _issue_token(make_client(), timedelta(hours=23))
+
+    client = make_client()
+    assert client._load_token() is True
+    assert client.access_token == "cached-token"
+    assert client.multi_quote_headers["authorization"] == "Bearer cached-token"
+
+
+def test_saved_token_owner_only(make_client):
+    """토큰 파일은 소유자만 읽기/쓰기 가능"""
+    client = make_client()
+    _issue_token(client, timedelta(hours=23))
+
+    mode = stat.S_IMODE(client.token_cache_path.stat().st_mode)
+    assert mode == 0o600
+    assert not client.token_cache_path.with_suffix(".tmp").exists()
+
+
+def test_expired_token_not_loaded(make_client):
+    """만료 1시간 이내 토큰은 로드하지 않음"""
+    _issue_token(make_client(), timedelta(minutes=30))
+
+    client = make_client()
+    assert client._load_token() is False
+    assert client.access_token is None
+
+
+def test_token_for_other_app_key_not_loaded(make_client):
+    """다른 앱키/모드로 발급된 토큰은 로드하지 않음"""
+    client = make_client()
+    _issue_token(client, timedelta(hours=23))
+
+    data = orjson.loads(client.token_cache_path.read_bytes())
+    client.token_cache_path.write_bytes(orjson.dumps({**data, "app_key": "other-app-key"}))
+
+    assert make_client()._load_token() is False
+
+
+def test_corrupted_token_file_not_loaded(make_client):
+    """깨진 토큰 파일은 무시"""
+    client = make_client()
+    client.token_cache_path.write_text("{not json")
+
+    assert client._load_token() is False
+    assert client.access_token is None
+
+
+def test_invalidate_token(make_client):
+    """토큰 폐기 시 메모리와 파일 모두 삭제"""
+    client = make_client()
+    _issue_token(client, timedelta(hours=23))
+
+    client._invalidate_token()
+
+    assert client.access_token is None
+    assert client.token_expires_at is None
+    assert not client.token_cache_path.exists()
+    assert make_client()._load_token() is False
+
+
+def test_get_access_token_reuses_cached_token(make_client):
+    """유효한 캐시 토큰이 있으면 발급 API를 호출하지 않음"""
+    _issue_token(make_client(), timedelta(hours=23))
+
+    client = make_client()
+
+    async def _fail_post(*args, **kwargs):
+        raise AssertionError("토큰 발급 API가 호출되면 안 됩니다")
+
+    client.client.post = _fail_post
+
+    assert asyncio.run(client.get_access_token()) == "cached-token"
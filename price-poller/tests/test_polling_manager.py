@@ -0,0 +1,89 @@
+"""
+PollingManager 배치 폴링 테스트 (KIS 클라이언트 / DB writer 대체)
+
+pytest price-poller/tests/test_polling_manager.py -v
+"""
+
+import asyncio
+import time
+
+import httpx
+
+from app.polling_manager import PollingManager
+
+
+class _FakeKISClient:
+    """호출 시작 시각을 기록하는 가짜 KIS 클라이언트 (fail_once 배치는 첫 호출만 실패)"""
+
+    def __init__(self, fail_once=(), latency: float = 0.05):
+        self.fail_once = set(fail_once)
+        self.latency = latency
+        self.starts = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_multi_quote(self, batch):
+        self.starts.append(time.monotonic())
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if batch[0] in self.fail_once:
+                self.fail_once.discard(batch[0])
+                raise httpx.ConnectError("connection reset")
+            return {ticker: {} for ticker in batch}
+        finally:
+            self.in_flight -= 1
+
+
+class _FakeDBWriter:
+    """저장 요청 종목 수만 기록하는 가짜 DB writer"""
+
+    def __init__(self):
+        self.saved = 0
+
+    def batch_update_realtime_prices(self, prices, session):
+        self.saved += len(prices)
+        return len(prices)
+
+
+def _poll(client, tickers):
+    manager = PollingManager()
+    manager.batch_size = 2
+    manager.polling_interval = 0.1
+    manager.cycle_complete_delay = 0
+    manager.write_window = 0
+    db_writer = _FakeDBWriter()
+
+    async def _run():
+        try:
+            await manager._poll_multi(client, db_writer, tickers)
+        finally:
+            await manager._stop_writer()
+
+    asyncio.run(_run())
+    return manager, db_writer
+
+
+def test_poll_multi_paces_request_starts():
+    """호출 시작 간격은 polling_interval 이상, 동시 진행은 max_in_flight 이하"""
+    client = _FakeKISClient(latency=0.15)
+    manager, db_writer = _poll(client, [f"t{i}" for i in range(10)])
+
+    gaps = [b - a for a, b in zip(client.starts, client.starts[1:])]
+    assert len(client.starts) == 5
+    assert min(gaps) >= manager.polling_interval - 0.01
+    assert client.max_in_flight <= manager.max_in_flight
+    assert db_writer.saved == 10
+
+
+def test_poll_multi_retries_through_pacer():
+    """실패한 배치의 재시도도 다른 호출과 polling_interval 간격 유지"""
+    client = _FakeKISClient(fail_once={"t2"})
+    manager, db_writer = _poll(client, [f"t{i}" for i in range(6)])
+
+    gaps = [b - a for a, b in zip(client.starts, client.starts[1:])]
+    assert len(client.starts) == 4  # 3개 배치 + 재시도 1회
+    assert min(gaps) >= manager.polling_interval - 0.01
+    assert db_writer.saved == 6
+    assert manager._written == 6